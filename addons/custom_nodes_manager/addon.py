@@ -12,6 +12,7 @@ from typing import Any
 import gradio as gr
 
 from core.base_addon import BaseAddon
+from core.config_loader import load_config_file
 
 
 class NodeStatus(Enum):
@@ -70,8 +71,7 @@ class CustomNodesManagerAddon(BaseAddon):
         """Load main config."""
         for config_path in [self.USER_CONFIG_DIR / "config.json", self.CONFIG_DIR / "config.json"]:
             if config_path.exists():
-                with open(config_path, encoding="utf-8") as f:
-                    self._config = json.load(f)
+                self._config = load_config_file(config_path)
                 break
 
     def _load_nodes_config(self) -> None:
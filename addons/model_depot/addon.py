@@ -1,17 +1,25 @@
 """Model Depot Addon - Workflow-based model management aligned with Workflow Manager."""
 
-import json
+import contextlib
+import hashlib
+import http.client
 import os
+import re
 import shutil
+import socket
+import ssl
 import threading
+import urllib.request
 from dataclasses import dataclass
 from enum import Enum
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any
 
 import gradio as gr
 
 from core.base_addon import BaseAddon
+from core.config_loader import load_config_file
+from core.json_utils import load_file
 
 
 class ModelStatus(Enum):
@@ -24,7 +32,7 @@ class ModelStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelInfo:
     """Model information from workflow_models.json."""
 
@@ -38,6 +46,13 @@ class ModelInfo:
     backup_size: int = 0  # Actual size in backup
 
 
+# Model file extensions (lower-case, for str.endswith)
+_MODEL_EXTENSIONS = (".safetensors", ".ckpt", ".pt", ".pth", ".bin", ".gguf")
+
+# Word characters, dots, dashes and "/" only (empty target_path allowed)
+_SAFE_PATH_RE = re.compile(r"[\w./-]*")
+
+
 def _sanitize_path(base_path: Path, target_path: str, filename: str) -> Path | None:
     """Sanitize and validate a file path to prevent directory traversal.
 
@@ -47,7 +62,7 @@ def _sanitize_path(base_path: Path, target_path: str, filename: str) -> Path | N
         filename: The filename
 
     Returns:
-        Safe absolute path, or None if path is invalid/unsafe
+        Safe path under base_path, or None if path is invalid/unsafe
     """
     # Block obvious traversal attempts
     if ".." in target_path or ".." in filename:
@@ -55,13 +70,16 @@ def _sanitize_path(base_path: Path, target_path: str, filename: str) -> Path | N
     if target_path.startswith("/") or filename.startswith("/"):
         return None
 
+    # Fast path: plain relative names cannot escape base_path, skip the FS lookup
+    if _SAFE_PATH_RE.fullmatch(target_path) and _SAFE_PATH_RE.fullmatch(filename):
+        return base_path / target_path / filename
+
     # Normalize and resolve
     try:
         full_path = (base_path / target_path / filename).resolve()
 
         # Verify the resolved path is still under base_path
-        base_resolved = base_path.resolve()
-        if not str(full_path).startswith(str(base_resolved)):
+        if not full_path.is_relative_to(base_path.resolve()):
             return None
 
         return full_path
@@ -69,6 +87,106 @@ def _sanitize_path(base_path: Path, target_path: str, filename: str) -> Path | N
         return None
 
 
+# Bytes hashed from start and end of a file when comparing copies
+_HASH_SAMPLE_SIZE = 1024 * 1024
+
+
+def _hash_head_tail(path: Path) -> str:
+    """Hash the first and last MiB of a file (cheap identity check for large models)."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        h.update(f.read(_HASH_SAMPLE_SIZE))
+        size = os.fstat(f.fileno()).st_size
+        if size > _HASH_SAMPLE_SIZE:
+            f.seek(max(size - _HASH_SAMPLE_SIZE, _HASH_SAMPLE_SIZE))
+            h.update(f.read(_HASH_SAMPLE_SIZE))
+    return h.hexdigest()
+
+
+def _maybe_copy(src: Path, dst: Path) -> bool:
+    """Copy src to dst unless dst already holds the same file.
+
+    Compares size first, then a head/tail hash, so multi-GB models that are
+    already in place are not rewritten.
+
+    Returns:
+        True if the file was copied, False if dst was already up to date
+    """
+    try:
+        dst_size = dst.stat().st_size
+    except OSError:
+        dst_size = -1
+
+    if dst_size == src.stat().st_size and _hash_head_tail(src) == _hash_head_tail(dst):
+        return False
+
+    shutil.copy2(src, dst)
+    return True
+
+
+# Download progress granularity that triggers a UI table refresh
+_PROGRESS_STEP_PERCENT = 5
+_PROGRESS_STEP_BYTES = 256 * 1024 * 1024
+
+
+# Socket receive buffer for model downloads (default ~200 KiB limits fast links)
+_DOWNLOAD_RCVBUF = 4 * 1024 * 1024
+
+
+def _table_hash(table: list[list[Any]]) -> int:
+    """Hash of models table content, used to skip re-sending an unchanged table."""
+    return hash(tuple(map(tuple, table)))
+
+
+def _create_download_socket(
+    address: tuple[str, int], timeout: Any = None, source_address: Any = None
+) -> socket.socket:
+    """socket.create_connection() that sets SO_RCVBUF before connecting.
+
+    The TCP window scale is negotiated in the handshake, so a receive buffer
+    enlarged after connect() cannot grow the window beyond what was offered.
+    """
+    host, port = address
+    err: OSError | None = None
+    for family, sock_type, proto, _, sockaddr in socket.getaddrinfo(
+        host, port, 0, socket.SOCK_STREAM
+    ):
+        sock = socket.socket(family, sock_type, proto)
+        try:
+            with contextlib.suppress(OSError):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _DOWNLOAD_RCVBUF)
+            # http.client passes a sentinel object for "no explicit timeout"
+            if timeout is None or isinstance(timeout, (int, float)):
+                sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as e:
+            err = e
+            sock.close()
+    raise err or OSError(f"getaddrinfo returned no addresses for {host}")
+
+
+class _DownloadHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection with an enlarged receive buffer for large downloads.
+
+    TCP_NODELAY is already set by http.client.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Hook http.client uses to open the socket in connect()
+        self._create_connection = _create_download_socket
+
+
+class _DownloadHTTPSHandler(urllib.request.HTTPSHandler):
+    """urllib handler that opens connections via _DownloadHTTPSConnection."""
+
+    def https_open(self, req):
+        return self.do_open(_DownloadHTTPSConnection, req, context=self._context)
+
+
 class ModelDepotAddon(BaseAddon):
     """Model Depot - aligned with Workflow Manager architecture.
 
@@ -82,6 +200,8 @@ class ModelDepotAddon(BaseAddon):
 
     # VRAM tiers matching Workflow Manager
     VRAM_TIERS = {"S": [8, 12], "M": [16], "L": [24, 32]}
+    # Reverse lookup: vram_gb -> tier
+    _VRAM_TO_TIER = {vram: tier for tier, vrams in VRAM_TIERS.items() for vram in vrams}
 
     # Allowed target folders (whitelist)
     ALLOWED_FOLDERS = {
@@ -97,6 +217,8 @@ class ModelDepotAddon(BaseAddon):
         "vae",
         "LLM",
     }
+    # Frozen copy for _is_allowed_folder: one lookup per path component
+    _ALLOWED_PREFIXES = frozenset(ALLOWED_FOLDERS)
 
     def __init__(self):
         super().__init__()
@@ -106,6 +228,7 @@ class ModelDepotAddon(BaseAddon):
 
         self._config: dict[str, Any] = {}
         self._workflow_models: dict[str, Any] = {}
+        self._wf_mtime_ns: int | None = None
         self._comfyui_path: Path | None = None
         self._models_path: Path | None = None
         self._workflows_path: Path | None = None
@@ -113,6 +236,13 @@ class ModelDepotAddon(BaseAddon):
 
         self._download_progress: dict[str, float] = {}
         self._download_status: dict[str, str] = {}
+        self._opener: urllib.request.OpenerDirector | None = None
+        # Bumped on meaningful download progress; the UI timer skips refreshes otherwise
+        self._progress_counter = 0
+        # Held while a UI refresh rebuilds the models table (button and timer share it)
+        self._refresh_lock = threading.Lock()
+        # (workflow_id, tier, table, hash) of the last rebuilt table, served while busy
+        self._last_refresh: tuple[str, str, list[list[Any]], int] | None = None
 
     def get_tab_name(self) -> str:
         return f"{self.icon} {self.name}"
@@ -128,12 +258,10 @@ class ModelDepotAddon(BaseAddon):
 
         self._config_source = None
         if user_file.exists():
-            with open(user_file, encoding="utf-8") as f:
-                self._config = json.load(f)
+            self._config = load_config_file(user_file)
             self._config_source = ".config/config.json"
         elif default_file.exists():
-            with open(default_file, encoding="utf-8") as f:
-                self._config = json.load(f)
+            self._config = load_config_file(default_file)
             self._config_source = "config/config.json"
 
     def _load_workflow_models(self) -> None:
@@ -146,13 +274,27 @@ class ModelDepotAddon(BaseAddon):
         }
 
         git_file = self.DATA_DIR / "workflow_models.json"
-        if git_file.exists():
-            with open(git_file, encoding="utf-8") as f:
-                self._workflow_models = json.load(f)
+        try:
+            self._wf_mtime_ns = git_file.stat().st_mtime_ns
+        except OSError:
+            self._wf_mtime_ns = None
+
+        if self._wf_mtime_ns is not None:
+            self._workflow_models = load_file(git_file)
             self._models_source = "data/workflow_models.json"
         else:
             self._models_source = "not found"
 
+    def _reload_if_changed(self) -> None:
+        """Reload workflow_models.json only if it changed on disk (e.g. by Workflow Manager)."""
+        try:
+            mtime_ns = (self.DATA_DIR / "workflow_models.json").stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if mtime_ns != self._wf_mtime_ns:
+            self._load_workflow_models()
+
     def _detect_paths(self) -> None:
         paths_config = self._config.get("paths", {})
 
@@ -188,15 +330,12 @@ class ModelDepotAddon(BaseAddon):
             return False
 
         # Direct match
-        if target_path in self.ALLOWED_FOLDERS:
+        if target_path in self._ALLOWED_PREFIXES:
             return True
 
         # Check if it's a subfolder of an allowed folder
-        for folder in self.ALLOWED_FOLDERS:
-            if target_path.startswith(folder + "/"):
-                return True
-
-        return False
+        path = PurePosixPath(target_path)
+        return any(str(parent) in self._ALLOWED_PREFIXES for parent in (path, *path.parents))
 
     def _get_disk_info(self) -> str:
         """Get disk space info for model paths."""
@@ -213,8 +352,6 @@ class ModelDepotAddon(BaseAddon):
                 return f"- {name}: Not found"
 
             try:
-                import shutil
-
                 usage = shutil.disk_usage(str(path))
                 free = format_size(usage.free)
                 total = format_size(usage.total)
@@ -266,12 +403,12 @@ class ModelDepotAddon(BaseAddon):
         wf = self._workflow_models.get("workflows", {}).get(workflow_id, {})
         model_sets = wf.get("model_sets", {})
 
-        available_tiers = set()
-        for set_name, set_data in model_sets.items():
-            vram = set_data.get("vram_gb", 0)
-            for tier, tier_vrams in self.VRAM_TIERS.items():
-                if vram in tier_vrams:
-                    available_tiers.add(tier)
+        vram_to_tier = self._VRAM_TO_TIER
+        available_tiers = {
+            vram_to_tier[vram]
+            for vram in (set_data.get("vram_gb", 0) for set_data in model_sets.values())
+            if vram in vram_to_tier
+        }
 
         return sorted(available_tiers)
 
@@ -281,12 +418,9 @@ class ModelDepotAddon(BaseAddon):
         model_sets = wf.get("model_sets", {})
         all_models = self._workflow_models.get("models", {})
 
-        tier_vrams = self.VRAM_TIERS.get(tier, [])
-
         model_ids = set()
-        for set_name, set_data in model_sets.items():
-            vram = set_data.get("vram_gb", 0)
-            if vram in tier_vrams:
+        for set_data in model_sets.values():
+            if self._VRAM_TO_TIER.get(set_data.get("vram_gb", 0)) == tier:
                 model_ids.update(set_data.get("models", []))
 
         result = []
@@ -327,6 +461,39 @@ class ModelDepotAddon(BaseAddon):
                 if model.status == ModelStatus.MISSING:
                     model.status = ModelStatus.BACKUP_ONLY
 
+    def refresh_models_table(
+        self, workflow_id: str, tier: str, last_hash: int | None
+    ) -> tuple[list[list[Any]] | None, int | None, bool]:
+        """Rebuild the models table for a UI refresh.
+
+        While another refresh is running, the last table built for the same
+        workflow/tier is returned instead of rebuilding it concurrently.
+
+        Args:
+            workflow_id: Selected workflow
+            tier: Selected VRAM tier
+            last_hash: Hash of the table the client currently shows
+
+        Returns:
+            (table, hash, rebuilt) - table is None when the client already
+            shows that content; rebuilt is False when the lock was busy
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            last = self._last_refresh
+            if last is not None and last[:2] == (workflow_id, tier) and last[3] != last_hash:
+                return last[2], last[3], False
+            return None, last_hash, False
+        try:
+            table = self.get_models_table(workflow_id, tier)
+            table_hash = _table_hash(table)
+            self._last_refresh = (workflow_id, tier, table, table_hash)
+        finally:
+            self._refresh_lock.release()
+
+        if table_hash == last_hash:
+            return None, last_hash, True
+        return table, table_hash, True
+
     def get_models_table(self, workflow_id: str, tier: str) -> list[list[Any]]:
         """Get models as table data: [Status, Dateiname, Ordner, MB, Aktion]"""
         models = self.get_models_for_workflow_tier(workflow_id, tier)
@@ -363,8 +530,6 @@ class ModelDepotAddon(BaseAddon):
 
     def _get_ssl_context(self):
         """Get SSL context based on config (secure by default)."""
-        import ssl
-
         # Check config for SSL bypass (INSECURE - use only if needed)
         disable_ssl = self._config.get("security", {}).get("disable_ssl_verify", False)
 
@@ -377,6 +542,14 @@ class ModelDepotAddon(BaseAddon):
         # Default: secure SSL verification
         return ssl.create_default_context()
 
+    def _get_opener(self) -> urllib.request.OpenerDirector:
+        """Get the shared download opener (built once per addon)."""
+        if self._opener is None:
+            self._opener = urllib.request.build_opener(
+                _DownloadHTTPSHandler(context=self._get_ssl_context())
+            )
+        return self._opener
+
     def download_model(self, model_id: str) -> str:
         """Download a model to ComfyUI/models + backup."""
         models_data = self._workflow_models.get("models", {})
@@ -395,15 +568,8 @@ class ModelDepotAddon(BaseAddon):
             return "ComfyUI models path not configured"
 
         # Security: Validate target_path is in allowed folders
-        if target_path not in self.ALLOWED_FOLDERS:
-            # Check if it's a subfolder of an allowed folder
-            allowed = False
-            for folder in self.ALLOWED_FOLDERS:
-                if target_path.startswith(folder + "/") or target_path == folder:
-                    allowed = True
-                    break
-            if not allowed:
-                return f"Security: Invalid target folder '{target_path}'"
+        if not self._is_allowed_folder(target_path):
+            return f"Security: Invalid target folder '{target_path}'"
 
         # Security: Sanitize and validate paths
         target_file = _sanitize_path(self._models_path, target_path, filename)
@@ -421,19 +587,44 @@ class ModelDepotAddon(BaseAddon):
                 backup_file.parent.mkdir(parents=True, exist_ok=True)
 
         def download_thread():
-            import urllib.request
+            # Backup is written in lockstep with the target (one read, two writes)
+            backup_f = None
+            backup_started = False
+
+            def drop_backup(reason: Exception | None = None) -> None:
+                nonlocal backup_f
+                if reason is not None:
+                    print(f"[ModelDepot] Backup write failed for {filename}: {reason}")
+                if backup_f:
+                    backup_f.close()
+                    backup_f = None
+                # Only remove a backup this download started writing
+                if backup_started and backup_file.exists():
+                    backup_file.unlink()
 
             try:
                 self._download_progress[filename] = 0.0
                 self._download_status[filename] = "Starting..."
+                self._progress_counter += 1
 
-                ctx = self._get_ssl_context()
                 req = urllib.request.Request(url, headers={"User-Agent": "CindergaceToolkit/3.0"})
 
-                with urllib.request.urlopen(req, context=ctx, timeout=60) as response:
+                with (
+                    self._get_opener().open(req, timeout=60) as response,
+                    contextlib.ExitStack() as files,
+                ):
                     total_size = int(response.headers.get("Content-Length", 0))
                     downloaded = 0
                     chunk_size = 1024 * 1024
+                    last_step = (0, 0)
+
+                    if backup_file:
+                        try:
+                            # The stack closes it on errors; drop_backup() may close it early
+                            backup_f = files.enter_context(open(backup_file, "wb"))
+                            backup_started = True
+                        except OSError as e:
+                            drop_backup(e)
 
                     with open(target_file, "wb") as f:
                         while True:
@@ -441,6 +632,12 @@ class ModelDepotAddon(BaseAddon):
                             if not chunk:
                                 break
                             f.write(chunk)
+                            if backup_f:
+                                try:
+                                    backup_f.write(chunk)
+                                except OSError as e:
+                                    # Never fail the primary download because of the backup
+                                    drop_backup(e)
                             downloaded += len(chunk)
 
                             if total_size > 0:
@@ -452,17 +649,36 @@ class ModelDepotAddon(BaseAddon):
                                     f"⬇️ {mb_done:.0f}/{mb_total:.0f} MB"
                                 )
 
-                if backup_file:
-                    self._download_status[filename] = "Backing up..."
-                    shutil.copy2(target_file, backup_file)
+                            step = (
+                                int(downloaded * 100 / total_size) // _PROGRESS_STEP_PERCENT
+                                if total_size > 0
+                                else 0,
+                                downloaded // _PROGRESS_STEP_BYTES,
+                            )
+                            if step != last_step:
+                                last_step = step
+                                self._progress_counter += 1
+
+                if backup_f:
+                    try:
+                        backup_f.close()
+                        shutil.copystat(target_file, backup_file)
+                    except OSError as e:
+                        drop_backup(e)
+                    backup_f = None
+                    backup_started = False
 
                 del self._download_progress[filename]
                 self._download_status[filename] = "Done"
+                self._progress_counter += 1
 
             except Exception as e:
+                self._download_progress.pop(filename, None)
                 self._download_status[filename] = f"❌ {str(e)[:50]}"
+                self._progress_counter += 1
                 if target_file.exists():
                     target_file.unlink()
+                drop_backup()
 
         thread = threading.Thread(target=download_thread, daemon=True)
         thread.start()
@@ -498,7 +714,8 @@ class ModelDepotAddon(BaseAddon):
             return f"Security: Invalid target path for {filename}"
 
         target_file.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(backup_file, target_file)
+        if not _maybe_copy(backup_file, target_file):
+            return f"Already present: {filename}"
         return f"Restored: {filename}"
 
     def find_other_models(self, workflow_id: str, tier: str) -> list[tuple[str, str, int]]:
@@ -517,22 +734,25 @@ class ModelDepotAddon(BaseAddon):
 
         # Scan ComfyUI/models for all model files
         other_models = []
-        model_extensions = {".safetensors", ".ckpt", ".pt", ".pth", ".bin", ".gguf"}
 
         for folder in self._workflow_models.get("target_folders", []):
             # Security: Only scan folders in the allowlist
             if not self._is_allowed_folder(folder):
                 continue
 
-            folder_path = self._models_path / folder
-            if not folder_path.exists():
+            try:
+                entries = os.scandir(self._models_path / folder)
+            except OSError:
                 continue
 
-            for file in folder_path.iterdir():
-                if file.is_file() and file.suffix.lower() in model_extensions:
-                    if (folder, file.name) not in expected:
-                        size_mb = file.stat().st_size // (1024 * 1024)
-                        other_models.append((file.name, folder, size_mb))
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.lower().endswith(_MODEL_EXTENSIONS) or not entry.is_file():
+                        continue
+                    if (folder, name) not in expected:
+                        size_mb = entry.stat().st_size // (1024 * 1024)
+                        other_models.append((name, folder, size_mb))
 
         return sorted(other_models)
 
@@ -630,8 +850,8 @@ class ModelDepotAddon(BaseAddon):
 
             status_output = gr.Textbox(label="Status", lines=3, interactive=False)
 
-            # Auto-refresh timer (every 3 seconds while downloads active)
-            auto_refresh_timer = gr.Timer(value=3, active=False)
+            # Auto-refresh timer (cheap tick while downloads active, see on_auto_refresh)
+            auto_refresh_timer = gr.Timer(value=1, active=False)
 
             gr.Markdown("---")
 
@@ -693,15 +913,17 @@ class ModelDepotAddon(BaseAddon):
             current_workflow = gr.State(value=None)
             current_tier = gr.State(value=None)
             other_models_state = gr.State(value=[])
+            last_progress_seen = gr.State(value=-1)
+            last_table_hash = gr.State(value=None)
 
             # === Event Handlers ===
 
             def on_workflow_change(wf_id):
                 if not wf_id:
-                    return gr.update(choices=[], value=None), [], wf_id
+                    return gr.update(choices=[], value=None), [], wf_id, None
 
-                # Reload data to get latest changes from Workflow Manager
-                self._load_workflow_models()
+                # Pick up changes from Workflow Manager
+                self._reload_if_changed()
 
                 tiers = self.get_vram_tiers_for_workflow(wf_id)
                 tier_choices = [
@@ -712,14 +934,15 @@ class ModelDepotAddon(BaseAddon):
                     gr.update(choices=tier_choices, value=tiers[0] if tiers else None),
                     [],
                     wf_id,
+                    None,
                 )
 
             def on_tier_change(wf_id, tier):
                 if not wf_id or not tier:
-                    return [], tier
+                    return [], tier, None
 
                 table = self.get_models_table(wf_id, tier)
-                return table, tier
+                return table, tier, _table_hash(table)
 
             def on_download_all(wf_id, tier):
                 if not wf_id or not tier:
@@ -742,14 +965,14 @@ class ModelDepotAddon(BaseAddon):
                 # Activate auto-refresh timer
                 return "\n".join(started), gr.update(active=True)
 
-            def on_refresh(wf_id, tier):
+            def on_refresh(wf_id, tier, last_hash):
                 if not wf_id or not tier:
-                    return [], "", gr.update(active=False)
+                    return [], "", gr.update(active=False), None
 
-                # Reload workflow_models.json to get latest changes
-                self._load_workflow_models()
+                # Pick up changes to workflow_models.json
+                self._reload_if_changed()
 
-                table = self.get_models_table(wf_id, tier)
+                table, table_hash, _ = self.refresh_models_table(wf_id, tier, last_hash)
 
                 status_lines = []
                 downloads_active = False
@@ -761,17 +984,26 @@ class ModelDepotAddon(BaseAddon):
                 # Deactivate timer if no downloads running
                 timer_update = gr.update(active=downloads_active)
                 return (
-                    table,
+                    gr.update() if table is None else table,
                     "\n".join(status_lines) if status_lines else "Data refreshed",
                     timer_update,
+                    table_hash,
                 )
 
-            def on_auto_refresh(wf_id, tier):
-                """Auto-refresh triggered by timer."""
+            def on_auto_refresh(wf_id, tier, last_seen, last_hash):
+                """Auto-refresh triggered by timer.
+
+                Only rebuilds the table when a download reported progress
+                since the last tick, and only sends it when it changed.
+                """
                 if not wf_id or not tier:
-                    return [], "", gr.update(active=False)
+                    return [], "", gr.update(active=False), last_seen, None
 
-                table = self.get_models_table(wf_id, tier)
+                counter = self._progress_counter
+                if counter == last_seen:
+                    return gr.update(), gr.update(), gr.update(), last_seen, last_hash
+
+                table, table_hash, rebuilt = self.refresh_models_table(wf_id, tier, last_hash)
 
                 status_lines = []
                 downloads_active = bool(self._download_progress)
@@ -780,7 +1012,14 @@ class ModelDepotAddon(BaseAddon):
 
                 # Deactivate timer if no downloads running
                 timer_update = gr.update(active=downloads_active)
-                return table, "\n".join(status_lines) if status_lines else "", timer_update
+                return (
+                    gr.update() if table is None else table,
+                    "\n".join(status_lines) if status_lines else "",
+                    timer_update,
+                    # A skipped rebuild may miss this progress; retry on the next tick
+                    counter if rebuilt else last_seen,
+                    table_hash,
+                )
 
             def on_scan_other(wf_id, tier):
                 if not wf_id or not tier:
@@ -832,13 +1071,13 @@ class ModelDepotAddon(BaseAddon):
             workflow_dropdown.change(
                 on_workflow_change,
                 inputs=[workflow_dropdown],
-                outputs=[tier_dropdown, models_table, current_workflow],
+                outputs=[tier_dropdown, models_table, current_workflow, last_table_hash],
             )
 
             tier_dropdown.change(
                 on_tier_change,
                 inputs=[current_workflow, tier_dropdown],
-                outputs=[models_table, current_tier],
+                outputs=[models_table, current_tier, last_table_hash],
             )
 
             download_all_btn.click(
@@ -849,14 +1088,20 @@ class ModelDepotAddon(BaseAddon):
 
             refresh_btn.click(
                 on_refresh,
-                inputs=[current_workflow, current_tier],
-                outputs=[models_table, status_output, auto_refresh_timer],
+                inputs=[current_workflow, current_tier, last_table_hash],
+                outputs=[models_table, status_output, auto_refresh_timer, last_table_hash],
             )
 
             auto_refresh_timer.tick(
                 on_auto_refresh,
-                inputs=[current_workflow, current_tier],
-                outputs=[models_table, status_output, auto_refresh_timer],
+                inputs=[current_workflow, current_tier, last_progress_seen, last_table_hash],
+                outputs=[
+                    models_table,
+                    status_output,
+                    auto_refresh_timer,
+                    last_progress_seen,
+                    last_table_hash,
+                ],
             )
 
             scan_other_btn.click(
@@ -1,15 +1,114 @@
 """System Info Addon - Display GPU, memory and disk information."""
 
+import contextlib
 import os
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 
 import gradio as gr
 
 from core.base_addon import BaseAddon
 
+try:
+    import pynvml
+except ImportError:  # pragma: no cover - optional dependency
+    pynvml = None
+
 PROJECT_DIR = Path(__file__).parent.parent.parent
+HOME_DIR = str(Path.home())
+
+# Background refresh interval per panel (seconds)
+PANEL_INTERVALS = {"gpu": 5, "mem": 5, "disk": 30, "env": 300, "toolkit": 600}
+
+# Environment variables overriding PANEL_INTERVALS
+POLL_ENV_VARS = {
+    "gpu": "CINDERGRACE_GPU_POLL_SEC",
+    "mem": "CINDERGRACE_MEM_POLL_SEC",
+    "toolkit": "CINDERGRACE_TOOLKIT_POLL_SEC",
+}
+
+# Panels cheap enough to recompute synchronously on a refresh click
+FAST_PANELS = ("gpu", "mem", "disk", "env")
+
+# nvidia-smi streaming fallback (used when pynvml is not installed)
+GPU_QUERY = "index,name,memory.total,memory.used,memory.free,temperature.gpu"
+# nvidia-smi -lms follows the GPU poll interval, but never samples faster than this
+GPU_STREAM_MIN_MS = 250
+# Longest a read waits for the first sample of a freshly started nvidia-smi
+# (independent of -lms, so a long poll interval cannot stall the first render)
+GPU_STREAM_START_TIMEOUT = 2
+# nvidia-smi prints all GPUs of a sample back to back: once the first row is
+# in, wait at most this long for the rest instead of for the next sample
+GPU_STREAM_SETTLE_SEC = 0.2
+# Grace period for nvidia-smi to exit after terminate() before it is killed
+GPU_STREAM_STOP_TIMEOUT = 5
+
+# Without a usable nvidia-smi, re-probe after this delay (doubling up to the max)
+GPU_REPROBE_MIN_SEC = 600
+GPU_REPROBE_MAX_SEC = 3600
+NO_GPU_PANEL = "### GPU Information\n\nKeine GPU erkannt (nvidia-smi nicht verfügbar)\n"
+
+# Mount points shown in the disk panel when present (home is the fallback)
+DISK_CANDIDATES = (("/workspace", "Workspace"), ("/content", "Colab Content"))
+
+# Remote check: `git fetch` at most this often (seconds), stamp survives restarts
+FETCH_INTERVAL = 600
+FETCH_STAMP_FILE = PROJECT_DIR / ".cindergrace_last_fetch"
+
+# Current branch is marked by %(HEAD) == "*"; track reads e.g. "[behind 3]"
+TOOLKIT_REF_FORMAT = "%(HEAD)%09%(refname:short)%09%(objectname:short)%09%(upstream:track)"
+
+# Minimal environment for short local queries (nvidia-smi, git for-each-ref)
+QUICK_ENV = {"PATH": os.environ.get("PATH", os.defpath), "HOME": os.environ.get("HOME", "")}
+
+GB = 1 << 30
+
+# /proc/meminfo fits in one read of this size (same as procps)
+MEMINFO_BUFSIZE = 8192
+
+
+def _poll_intervals() -> dict[str, float]:
+    """PANEL_INTERVALS with overrides from POLL_ENV_VARS applied."""
+    intervals = dict(PANEL_INTERVALS)
+    for key, var in POLL_ENV_VARS.items():
+        value = os.environ.get(var)
+        if not value:
+            continue
+        try:
+            seconds = float(value)
+        except ValueError:
+            seconds = 0
+        if seconds > 0:
+            intervals[key] = seconds
+        else:
+            print(f"[SystemInfo] Ignoring invalid {var}={value!r}")
+    return intervals
+
+
+def _run_quick(args: list[str], **kwargs) -> subprocess.CompletedProcess:
+    """Run a short local query without the fd sweep and with a minimal environment.
+
+    Python's own fds are non-inheritable (PEP 446), so close_fds=False is safe.
+    """
+    return subprocess.run(
+        args, capture_output=True, text=True, close_fds=False, env=QUICK_ENV, **kwargs
+    )
+
+
+def _meminfo_kb(buf: bytes, key: bytes) -> int | None:
+    """Extract a kB value (e.g. key=b"MemTotal:") from raw /proc/meminfo bytes."""
+    start = buf.find(key)
+    # Keys must start a line ("MemFree:" must not match inside "SwapMemFree:")
+    while start > 0 and buf[start - 1] != ord("\n"):
+        start = buf.find(key, start + 1)
+    if start < 0:
+        return None
+    end = buf.find(b"\n", start)
+    fields = buf[start + len(key) : end if end >= 0 else None].split()
+    return int(fields[0]) if fields else None
 
 
 class SystemInfoAddon(BaseAddon):
@@ -20,6 +119,10 @@ class SystemInfoAddon(BaseAddon):
     - Memory usage
     - Disk space
     - Environment detection (RunPod/Colab/Local)
+
+    Panels are refreshed by a background poller at PANEL_INTERVALS
+    (overridable via POLL_ENV_VARS);
+    the UI only reads the cached markdown.
     """
 
     def __init__(self):
@@ -28,60 +131,315 @@ class SystemInfoAddon(BaseAddon):
         self.version = "1.0.0"
         self.icon = "💻"
 
+        self._intervals = _poll_intervals()
+        self._cache: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._next_refresh: dict[str, float] = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._poller: threading.Thread | None = None
+
+        # GPU sources: NVML handles, or a long-lived nvidia-smi -lms process
+        self._gpu_handles: list | None = None
+        self._gpu_proc: subprocess.Popen | None = None
+        # Serializes starting, stopping and polling the nvidia-smi process
+        self._gpu_lock = threading.Lock()
+        self._gpu_rows: dict[str, tuple[str, str, str, str, str]] = {}
+        self._gpu_rows_ready = threading.Event()
+        self._gpu_first_row = threading.Event()
+        self._gpu_reprobe_at = 0.0
+        self._gpu_reprobe_delay = GPU_REPROBE_MIN_SEC
+        # Checked once on the first GPU read (None = not checked yet)
+        self._persistence_off: bool | None = None
+
+        self._last_fetch = self._read_fetch_stamp()
+        # /proc/meminfo stays open for the addon's lifetime (opened on first read)
+        self._meminfo_fd: int | None = None
+
+        # Platform and mount points don't change at runtime: detect once
+        self._disk_paths = self._detect_disk_paths()
+        self._environment = self._detect_environment()
+
     def get_tab_name(self) -> str:
         return f"{self.icon} {self.name}"
 
-    def get_gpu_info(self) -> str:
-        """Get GPU information using nvidia-smi."""
+    def on_load(self) -> None:
+        self._init_nvml()
+        self._stop.clear()
+        self._poller = threading.Thread(target=self._poll_loop, daemon=True)
+        self._poller.start()
+
+    def on_unload(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+        if self._gpu_handles is not None:
+            with contextlib.suppress(pynvml.NVMLError):
+                pynvml.nvmlShutdown()
+            self._gpu_handles = None
+
+        self._stop_gpu_stream()
+
+        if self._meminfo_fd is not None:
+            os.close(self._meminfo_fd)
+            self._meminfo_fd = None
+
+    # === Panel Cache ===
+
+    def _compute_panel(self, key: str) -> str:
+        getters = {
+            "gpu": self.get_gpu_info,
+            "mem": self.get_memory_info,
+            "disk": self.get_disk_info,
+            "env": self.get_environment,
+            "toolkit": self.get_toolkit_info,
+        }
+        return getters[key]()
+
+    def _refresh_panel(self, key: str) -> str:
+        """Recompute a panel and store it in the cache."""
+        value = self._compute_panel(key)
+        with self._lock:
+            self._cache[key] = value
+            self._next_refresh[key] = time.monotonic() + self._intervals[key]
+        return value
+
+    def _get_panel(self, key: str) -> str:
+        """Get cached panel markdown (computed on first access)."""
+        with self._lock:
+            value = self._cache.get(key)
+        if value is None:
+            value = self._refresh_panel(key)
+        return value
+
+    def _poll_loop(self) -> None:
+        """Refresh each panel at its own cadence until unloaded."""
+        while not self._stop.is_set():
+            for key in PANEL_INTERVALS:
+                with self._lock:
+                    due = self._next_refresh.get(key, 0.0) <= time.monotonic()
+                if due:
+                    try:
+                        if key == "toolkit":
+                            self._maybe_fetch()
+                        self._refresh_panel(key)
+                    except Exception as e:
+                        print(f"[SystemInfo] Refresh of {key} failed: {e}")
+                        with self._lock:
+                            self._next_refresh[key] = time.monotonic() + self._intervals[key]
+
+            with self._lock:
+                next_due = min(self._next_refresh.values(), default=time.monotonic())
+            self._wake.wait(max(next_due - time.monotonic(), 0.1))
+            self._wake.clear()
+
+    def _force_refresh(self) -> tuple[str, ...]:
+        """Recompute fast panels now and schedule the toolkit panel in the background."""
+        for key in FAST_PANELS:
+            self._refresh_panel(key)
+
+        with self._lock:
+            self._next_refresh["toolkit"] = 0.0
+        self._wake.set()
+
+        return tuple(self._get_panel(key) for key in PANEL_INTERVALS)
+
+    # === GPU Sources ===
+
+    def _init_nvml(self) -> None:
+        """Initialize NVML once and cache device handles (if pynvml is installed)."""
+        if pynvml is None:
+            return
+        try:
+            pynvml.nvmlInit()
+            self._gpu_handles = [
+                pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())
+            ]
+        except pynvml.NVMLError:
+            self._gpu_handles = None
+
+    def _read_nvml(self) -> list[tuple[str, str, str, str, str]]:
+        """Read GPU rows via NVML (no subprocess)."""
+        rows = []
+        mb = 1024 * 1024
+        for handle in self._gpu_handles:
+            name = pynvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):
+                name = name.decode()
+            mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+            rows.append(
+                (name, str(mem.total // mb), str(mem.used // mb), str(mem.free // mb), str(temp))
+            )
+        return rows
+
+    def _gpu_stream_ms(self) -> int:
+        """nvidia-smi sampling period in ms, derived from the GPU poll interval."""
+        return max(GPU_STREAM_MIN_MS, int(self._intervals["gpu"] * 1000))
+
+    def _start_gpu_stream(self) -> bool:
+        """Start a persistent nvidia-smi process that prints GPU rows every interval.
+
+        Caller must hold _gpu_lock.
+        """
         try:
-            result = subprocess.run(
+            self._gpu_proc = subprocess.Popen(
                 [
                     "nvidia-smi",
-                    "--query-gpu=name,memory.total,memory.used,memory.free,temperature.gpu",
+                    f"--query-gpu={GPU_QUERY}",
                     "--format=csv,noheader,nounits",
+                    "-lms",
+                    str(self._gpu_stream_ms()),
                 ],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
+            )
+        except OSError:
+            self._gpu_proc = None
+            return False
+
+        threading.Thread(target=self._read_gpu_stream, args=(self._gpu_proc,), daemon=True).start()
+        return True
+
+    def _stop_gpu_stream(self) -> None:
+        """Terminate the nvidia-smi process and reap it."""
+        with self._gpu_lock:
+            proc, self._gpu_proc = self._gpu_proc, None
+        if proc is None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=GPU_STREAM_STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def _read_gpu_stream(self, proc: subprocess.Popen) -> None:
+        """Store the latest row per GPU index from the nvidia-smi stream."""
+        for line in proc.stdout:
+            fields = line.split(",", 5)
+            if len(fields) == 6:
+                index, name, total, used, free, temp = (f.strip() for f in fields)
+                with self._lock:
+                    # A repeated index means one full sample of all GPUs was read
+                    if index in self._gpu_rows:
+                        self._gpu_rows_ready.set()
+                    self._gpu_rows[index] = (name, total, used, free, temp)
+                self._gpu_first_row.set()
+        # Process exited: unblock waiters
+        self._gpu_first_row.set()
+        self._gpu_rows_ready.set()
+
+    def _read_gpu_stream_rows(self) -> list[tuple[str, str, str, str, str]] | None:
+        """Get the latest streamed GPU rows, starting the stream if needed."""
+        with self._gpu_lock:
+            # Unloading: don't spawn a new process behind on_unload's back
+            if self._stop.is_set():
+                return None
+            if self._gpu_proc is None or self._gpu_proc.poll() is not None:
+                self._gpu_rows_ready.clear()
+                self._gpu_first_row.clear()
+                with self._lock:
+                    self._gpu_rows = {}
+                if not self._start_gpu_stream():
+                    return None
+            proc = self._gpu_proc
+
+        # First sample arrives right after nvidia-smi has started
+        if self._gpu_first_row.wait(timeout=GPU_STREAM_START_TIMEOUT):
+            # A repeated index ends this early; otherwise the first sample is complete
+            self._gpu_rows_ready.wait(timeout=GPU_STREAM_SETTLE_SEC)
+            self._gpu_rows_ready.set()
+
+        with self._lock:
+            rows = [self._gpu_rows[k] for k in sorted(self._gpu_rows, key=int)]
+        if not rows and proc.poll() is not None:
+            return None
+        return rows
+
+    def _check_persistence_mode(self) -> bool:
+        """Return True if persistence mode is disabled on any GPU.
+
+        Without it the driver is torn down between queries, which makes
+        every nvidia-smi call take up to a few seconds.
+        """
+        if self._gpu_handles is not None:
+            try:
+                return any(
+                    pynvml.nvmlDeviceGetPersistenceMode(h) == pynvml.NVML_FEATURE_DISABLED
+                    for h in self._gpu_handles
+                )
+            except pynvml.NVMLError:
+                return False
+
+        try:
+            result = _run_quick(
+                ["nvidia-smi", "--query-gpu=persistence_mode", "--format=csv,noheader"],
                 timeout=10,
             )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                output = "### GPU Information\n\n"
-                for i, line in enumerate(lines):
-                    parts = [p.strip() for p in line.split(",")]
-                    if len(parts) >= 5:
-                        name, total, used, free, temp = parts[:5]
-                        output += f"**GPU {i}:** {name}\n"
-                        output += f"- VRAM: {used} MB / {total} MB (frei: {free} MB)\n"
-                        output += f"- Temperatur: {temp}°C\n\n"
-                return output
-            return "nvidia-smi nicht verfügbar"
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0 and "Disabled" in result.stdout
+
+    def get_gpu_info(self) -> str:
+        """Get GPU information via NVML, or a persistent nvidia-smi stream."""
+        try:
+            if self._gpu_handles is not None:
+                rows = self._read_nvml()
+            else:
+                now = time.monotonic()
+                if now < self._gpu_reprobe_at:
+                    return NO_GPU_PANEL
+                rows = self._read_gpu_stream_rows()
+                if rows is None:
+                    # No GPU/driver: skip spawning nvidia-smi until the next re-probe
+                    self._gpu_reprobe_at = now + self._gpu_reprobe_delay
+                    self._gpu_reprobe_delay = min(self._gpu_reprobe_delay * 2, GPU_REPROBE_MAX_SEC)
+                    return NO_GPU_PANEL
+                self._gpu_reprobe_delay = GPU_REPROBE_MIN_SEC
+
+            parts = ["### GPU Information", ""]
+            for i, (name, total, used, free, temp) in enumerate(rows):
+                parts.append(f"**GPU {i}:** {name}")
+                parts.append(f"- VRAM: {used} MB / {total} MB (frei: {free} MB)")
+                parts.append(f"- Temperatur: {temp}°C")
+                parts.append("")
+
+            if self._persistence_off is None:
+                self._persistence_off = self._check_persistence_mode()
+            if self._persistence_off:
+                parts.append("⚠️ Persistence Mode aus — Abfragen langsam. `sudo nvidia-smi -pm 1`")
+            return "\n".join(parts) + "\n"
         except Exception as e:
             return f"GPU Info Fehler: {e}"
 
+    # === Panels ===
+
     def get_memory_info(self) -> str:
         """Get system memory information."""
         try:
-            with open("/proc/meminfo") as f:
-                lines = f.readlines()
-
-            mem_info = {}
-            for line in lines:
-                parts = line.split(":")
-                if len(parts) == 2:
-                    key = parts[0].strip()
-                    value = parts[1].strip().split()[0]
-                    mem_info[key] = int(value)
-
-            total_gb = mem_info.get("MemTotal", 0) / 1024 / 1024
-            free_gb = mem_info.get("MemAvailable", mem_info.get("MemFree", 0)) / 1024 / 1024
+            # Cached fd + pread: one syscall per poll, one consistent snapshot
+            with self._lock:
+                if self._meminfo_fd is None:
+                    self._meminfo_fd = os.open("/proc/meminfo", os.O_RDONLY)
+            buf = os.pread(self._meminfo_fd, MEMINFO_BUFSIZE, 0)
+
+            total_kb = _meminfo_kb(buf, b"MemTotal:") or 0
+            avail_kb = _meminfo_kb(buf, b"MemAvailable:")
+            if avail_kb is None:
+                avail_kb = _meminfo_kb(buf, b"MemFree:") or 0
+
+            total_gb = total_kb / 1024 / 1024
+            free_gb = avail_kb / 1024 / 1024
             used_gb = total_gb - free_gb
 
-            output = "### RAM\n\n"
-            output += f"- Gesamt: {total_gb:.1f} GB\n"
-            output += f"- Verwendet: {used_gb:.1f} GB\n"
-            output += f"- Verfügbar: {free_gb:.1f} GB\n"
-            return output
+            return (
+                "### RAM\n\n"
+                f"- Gesamt: {total_gb:.1f} GB\n"
+                f"- Verwendet: {used_gb:.1f} GB\n"
+                f"- Verfügbar: {free_gb:.1f} GB\n"
+            )
 
         except Exception as e:
             return f"Memory Info Fehler: {e}"
@@ -89,108 +447,141 @@ class SystemInfoAddon(BaseAddon):
     def get_disk_info(self) -> str:
         """Get disk space information."""
         try:
-            # Only show paths that exist
-            paths_to_check = []
-
-            if os.path.exists("/workspace"):
-                paths_to_check.append(("/workspace", "Workspace"))
-            if os.path.exists("/content"):
-                paths_to_check.append(("/content", "Colab Content"))
-            if not paths_to_check:
-                paths_to_check.append((str(Path.home()), "Home"))
-
-            output = "### Speicherplatz\n\n"
-
-            for path, label in paths_to_check:
-                stat = os.statvfs(path)
-                total_gb = (stat.f_blocks * stat.f_frsize) / (1024**3)
-                free_gb = (stat.f_bavail * stat.f_frsize) / (1024**3)
-                used_gb = total_gb - free_gb
-                percent = (used_gb / total_gb * 100) if total_gb > 0 else 0
-
-                output += f"**{label}** (`{path}`)\n"
-                output += f"- {used_gb:.1f} GB / {total_gb:.1f} GB ({percent:.0f}%)\n"
-                output += f"- Frei: {free_gb:.1f} GB\n\n"
-
-            return output if len(output) > 30 else "Keine Laufwerke gefunden"
+            parts = ["### Speicherplatz", ""]
+
+            for path, label in self._disk_paths:
+                try:
+                    stat = os.statvfs(path)
+                except (FileNotFoundError, PermissionError):
+                    continue
+                # Integer byte math; convert to GB only when formatting
+                total = stat.f_blocks * stat.f_frsize
+                free = stat.f_bavail * stat.f_frsize
+                used = total - free
+                percent = (used * 100 + total // 2) // total if total else 0
+
+                parts.append(f"**{label}** (`{path}`)")
+                parts.append(f"- {used / GB:.1f} GB / {total / GB:.1f} GB ({percent}%)")
+                parts.append(f"- Frei: {free / GB:.1f} GB")
+                parts.append("")
+
+            if len(parts) == 2:
+                return "Keine Laufwerke gefunden"
+            return "\n".join(parts) + "\n"
 
         except Exception as e:
             return f"Disk Info Fehler: {e}"
 
+    def _detect_disk_paths(self) -> list[tuple[str, str]]:
+        """Only show paths that exist (and can be statted)."""
+        paths = []
+        for path, label in DISK_CANDIDATES:
+            try:
+                os.statvfs(path)
+            except (FileNotFoundError, PermissionError):
+                continue
+            paths.append((path, label))
+        return paths or [(HOME_DIR, "Home")]
+
     def get_environment(self) -> str:
+        """Get current environment (detected once at startup)."""
+        return self._environment
+
+    def _detect_environment(self) -> str:
         """Detect current environment."""
-        output = "### Umgebung\n\n"
+        parts = ["### Umgebung", ""]
 
         if os.environ.get("RUNPOD_POD_ID") or (
             os.path.exists("/workspace") and not os.path.exists("/content")
         ):
-            output += "**Plattform:** 🚀 RunPod\n"
+            parts.append("**Plattform:** 🚀 RunPod")
             pod_id = os.environ.get("RUNPOD_POD_ID", "unbekannt")
-            output += f"- Pod ID: `{pod_id}`\n"
+            parts.append(f"- Pod ID: `{pod_id}`")
         elif os.path.exists("/content") and "COLAB_GPU" in os.environ:
-            output += "**Plattform:** 📓 Google Colab\n"
+            parts.append("**Plattform:** 📓 Google Colab")
         else:
-            output += "**Plattform:** 🖥️ Lokal\n"
+            parts.append("**Plattform:** 🖥️ Lokal")
 
-        output += f"- Python: {sys.version.split()[0]}\n"
+        parts.append(f"- Python: {sys.version.split()[0]}")
 
         cuda_version = os.environ.get("CUDA_VERSION", "unbekannt")
-        output += f"- CUDA: {cuda_version}\n"
+        parts.append(f"- CUDA: {cuda_version}")
 
-        return output
+        return "\n".join(parts) + "\n"
 
-    def get_toolkit_info(self) -> str:
-        """Get toolkit version and git status."""
-        output = "### Toolkit\n\n"
+    # === Toolkit Git Status ===
 
+    def _read_fetch_stamp(self) -> float:
         try:
-            # Get current commit
-            result = subprocess.run(
-                ["git", "rev-parse", "--short", "HEAD"],
-                cwd=PROJECT_DIR,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            commit = result.stdout.strip() if result.returncode == 0 else "unknown"
-
-            # Get branch
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=PROJECT_DIR,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            branch = result.stdout.strip() if result.returncode == 0 else "unknown"
+            return float(FETCH_STAMP_FILE.read_text().strip())
+        except (OSError, ValueError):
+            return 0.0
 
-            output += f"- Branch: `{branch}`\n"
-            output += f"- Commit: `{commit}`\n"
+    def _maybe_fetch(self) -> None:
+        """Run `git fetch` in the background poller if the last one is stale."""
+        now = time.time()
+        if now - self._last_fetch < FETCH_INTERVAL:
+            return
 
-            # Check for updates
+        self._last_fetch = now
+        try:
+            # Full environment: fetch may need SSH agent, proxy or credential settings
             subprocess.run(
                 ["git", "fetch", "--quiet"],
                 cwd=PROJECT_DIR,
                 capture_output=True,
+                close_fds=False,
                 timeout=30,
             )
+            FETCH_STAMP_FILE.write_text(f"{now:.0f}\n")
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"[SystemInfo] git fetch failed: {e}")
 
-            result = subprocess.run(
-                ["git", "status", "-uno"],
+    def get_toolkit_info(self) -> str:
+        """Get toolkit version and git status (local refs only, no network)."""
+        parts = ["### Toolkit", ""]
+
+        try:
+            # One call for branch, commit and upstream tracking state
+            result = _run_quick(
+                ["git", "for-each-ref", f"--format={TOOLKIT_REF_FORMAT}", "refs/heads"],
                 cwd=PROJECT_DIR,
-                capture_output=True,
-                text=True,
                 timeout=10,
             )
-            if "behind" in result.stdout:
-                output += "- Status: ⚠️ **Update verfügbar**\n"
+            branch, commit, track = "unknown", "unknown", ""
+            for line in result.stdout.splitlines() if result.returncode == 0 else ():
+                if line.startswith("*"):
+                    _, branch, commit, track = line.split("\t", 3)
+                    break
+            else:
+                # Detached HEAD: no branch is marked current
+                result = _run_quick(
+                    ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_DIR, timeout=10
+                )
+                if result.returncode == 0 and result.stdout.strip():
+                    branch, commit = "(detached)", result.stdout.strip()
+
+            parts.append(f"- Branch: `{branch}`")
+            parts.append(f"- Commit: `{commit}`")
+
+            # track is e.g. "[behind 3]" relative to the last background fetch
+            if "behind" in track:
+                parts.append("- Status: ⚠️ **Update verfügbar**")
             else:
-                output += "- Status: ✅ Aktuell\n"
+                parts.append("- Status: ✅ Aktuell")
 
         except Exception as e:
-            output += f"- Error: {e}\n"
+            parts.append(f"- Error: {e}")
+
+        return "\n".join(parts) + "\n"
 
-        return output
+    def _poll_footer(self) -> str:
+        """Small footer listing the active poll intervals and their env vars."""
+        rates = ", ".join(
+            f"{key.upper()} {self._intervals[key]:g}s (`{var}`)"
+            for key, var in POLL_ENV_VARS.items()
+        )
+        return f"<small>Aktualisierung im Hintergrund: {rates}</small>"
 
     def render(self) -> gr.Blocks:
         """Render the System Info UI."""
@@ -200,33 +591,35 @@ class SystemInfoAddon(BaseAddon):
 
             refresh_btn = gr.Button("🔄 Aktualisieren", variant="primary")
 
-            with gr.Row():
-                with gr.Column():
-                    gpu_info = gr.Markdown(self.get_gpu_info())
-                with gr.Column():
-                    mem_info = gr.Markdown(self.get_memory_info())
-
-            with gr.Row():
-                with gr.Column():
-                    disk_info = gr.Markdown(self.get_disk_info())
-                with gr.Column():
-                    env_info = gr.Markdown(self.get_environment())
-
-            with gr.Row():
-                toolkit_info = gr.Markdown(self.get_toolkit_info())
-
-            def on_refresh():
-                return (
-                    self.get_gpu_info(),
-                    self.get_memory_info(),
-                    self.get_disk_info(),
-                    self.get_environment(),
-                    self.get_toolkit_info(),
-                )
+            # One row; each Markdown stays independently updatable
+            with gr.Row(equal_height=True):
+                gpu_info = gr.Markdown(self._get_panel("gpu"))
+                mem_info = gr.Markdown(self._get_panel("mem"))
+                disk_info = gr.Markdown(self._get_panel("disk"))
+                env_info = gr.Markdown(self._get_panel("env"))
+
+            toolkit_info = gr.Markdown(self._get_panel("toolkit"))
+
+            gr.Markdown(self._poll_footer())
+
+            # Hash per panel of the markdown the client currently shows
+            shown_hashes = gr.State(
+                value={key: hash(self._get_panel(key)) for key in PANEL_INTERVALS}
+            )
+
+            def on_refresh(shown):
+                updates = []
+                new_shown = {}
+                for key, value in zip(PANEL_INTERVALS, self._force_refresh(), strict=True):
+                    new_shown[key] = hash(value)
+                    # Unchanged panels are not re-sent (no client repaint)
+                    updates.append(gr.update() if shown.get(key) == new_shown[key] else value)
+                return (*updates, new_shown)
 
             refresh_btn.click(
                 on_refresh,
-                outputs=[gpu_info, mem_info, disk_info, env_info, toolkit_info],
+                inputs=[shown_hashes],
+                outputs=[gpu_info, mem_info, disk_info, env_info, toolkit_info, shown_hashes],
             )
 
         return ui
@@ -1,16 +1,70 @@
 """Workflow Manager Addon - Create and manage workflow model definitions."""
 
-import json
-from pathlib import Path
+import bisect
+import fnmatch
+import os
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
 from typing import Any
 
 import gradio as gr
 
 from core.base_addon import BaseAddon
+from core.config_loader import load_config_file
+from core.json_utils import dump_file, load_file
 
 from .url_database import suggest_url
 from .workflow_parser import parse_workflow
 
+try:
+    import pandas as pd  # installed with gradio; gr.Dataframe passes DataFrames
+except ImportError:  # pragma: no cover - optional dependency
+    pd = None
+
+# filename -> model_id in one pass: "." and "-" become "_", ASCII is lowercased
+_MODEL_ID_TRANS = str.maketrans(
+    {".": "_", "-": "_", **{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)}}
+)
+
+# Normalized table row: (filename, target_path, size_mb, tier_checks, url)
+TableRow = tuple[str, str, int, list[Any], str]
+
+
+def _rows_from_lists(table_data: Iterable[list[Any]]) -> Iterator[TableRow]:
+    """Normalize list-of-lists table rows [filename, folder, mb, S, M, L, url]."""
+    for row in table_data:
+        if len(row) < 7 or not row[0]:
+            continue
+        yield (
+            str(row[0]).strip(),
+            str(row[1]).strip() if row[1] else "",
+            int(row[2]) if row[2] else 0,
+            row[3:6],
+            str(row[6]).strip() if row[6] else "",
+        )
+
+
+def _rows_from_frame(df: "pd.DataFrame") -> Iterator[TableRow]:
+    """Normalize a DataFrame table column-wise instead of per cell."""
+    if df.shape[1] < 7:
+        return iter(())
+
+    def text(col: int) -> list[str]:
+        return df.iloc[:, col].fillna("").astype(str).str.strip().tolist()
+
+    sizes = pd.to_numeric(df.iloc[:, 2], errors="coerce").fillna(0).astype("int64").tolist()
+    checks = df.iloc[:, 3:6].fillna(False).astype(bool).to_numpy().tolist()
+    return zip(text(0), text(1), sizes, checks, text(6), strict=True)
+
+
+@lru_cache(maxsize=8)
+def _folders_ui_state(folders: tuple[str, ...]) -> tuple[list[list[str]], list[str]]:
+    """Folder table rows and dropdown choices; treat the returned lists as read-only."""
+    return [[f] for f in folders], list(folders)
+
 
 class WorkflowManagerAddon(BaseAddon):
     """Workflow Manager with VRAM checkboxes and folder dropdown."""
@@ -22,6 +76,9 @@ class WorkflowManagerAddon(BaseAddon):
 
     # VRAM tiers: S=Small(8-12GB), M=Medium(16GB), L=Large(24-32GB)
     VRAM_TIERS = {"S": [8, 12], "M": [16], "L": [24, 32]}
+    # Bit v set for every VRAM value v of the tier
+    _TIER_MASKS = {tier: sum(1 << v for v in vrams) for tier, vrams in VRAM_TIERS.items()}
+    _MAX_TIER_VRAM = max(v for vrams in VRAM_TIERS.values() for v in vrams)
 
     # Allowed target folders (shared with Model Depot for consistency)
     ALLOWED_FOLDERS = {
@@ -37,6 +94,8 @@ class WorkflowManagerAddon(BaseAddon):
         "vae",
         "LLM",
     }
+    # Frozen copy for _is_allowed_folder: one lookup per path component
+    _ALLOWED_PREFIXES = frozenset(ALLOWED_FOLDERS)
 
     def __init__(self):
         super().__init__()
@@ -44,28 +103,85 @@ class WorkflowManagerAddon(BaseAddon):
         self.version = "5.1.0"
         self.icon = "📋"
 
-        self._config: dict[str, Any] = {}
-        self._workflow_models: dict[str, Any] = {}
-        self._workflows_path: Path | None = None
+        # Loaded on first access (see properties below); on_load warms them up
+        self._load_lock = threading.RLock()
+        self._config_data: dict[str, Any] | None = None
+        self._workflow_models_data: dict[str, Any] | None = None
+        self._workflows_path_value: Path | None = None
+        self._paths_detected = False
+        # Set by mutators; _save_workflow_models only writes when True
+        self._dirty = False
+        # (dir mtime_ns, pattern, matching workflow ids) of the last scan
+        self._scan_cache: tuple[int, str, list[str]] | None = None
+        self._pattern_re: tuple[str, re.Pattern] | None = None
+        # (scan result, dropdown choices) of the last scan_workflow_choices call
+        self._choices_cache: tuple[tuple, list[tuple[str, str]]] | None = None
 
     def get_tab_name(self) -> str:
         return f"{self.icon} {self.name}"
 
     def on_load(self) -> None:
-        self._load_config()
-        self._load_workflow_models()
-        self._detect_paths()
+        # Read files off the startup path; early UI access blocks on the load lock
+        threading.Thread(target=self._warm_up, daemon=True).start()
+
+    def _warm_up(self) -> None:
+        """Load config, workflow models and the workflow listing ahead of first use."""
+        self.get_target_folders()
+        self.scan_workflows()
+
+    # === Lazily loaded state ===
+
+    @property
+    def _config(self) -> dict[str, Any]:
+        if self._config_data is None:
+            with self._load_lock:
+                if self._config_data is None:
+                    self._load_config()
+        return self._config_data
+
+    @_config.setter
+    def _config(self, value: dict[str, Any]) -> None:
+        self._config_data = value
+
+    @property
+    def _workflow_models(self) -> dict[str, Any]:
+        if self._workflow_models_data is None:
+            with self._load_lock:
+                if self._workflow_models_data is None:
+                    self._load_workflow_models()
+        return self._workflow_models_data
+
+    @_workflow_models.setter
+    def _workflow_models(self, value: dict[str, Any]) -> None:
+        # Normalize once so callers can subscript these keys directly;
+        # target_folders is kept sorted so add_target_folder can insort
+        value.setdefault("target_folders", []).sort()
+        value.setdefault("workflows", {})
+        value.setdefault("models", {})
+        self._workflow_models_data = value
+
+    @property
+    def _workflows_path(self) -> Path | None:
+        if not self._paths_detected:
+            with self._load_lock:
+                if not self._paths_detected:
+                    self._detect_paths()
+        return self._workflows_path_value
+
+    @_workflows_path.setter
+    def _workflows_path(self, value: Path | None) -> None:
+        self._workflows_path_value = value
+        self._paths_detected = True
 
     def _load_config(self) -> None:
+        self._config = {}
         user_file = self.USER_CONFIG_DIR / "config.json"
         default_file = self.CONFIG_DIR / "config.json"
 
         if user_file.exists():
-            with open(user_file, encoding="utf-8") as f:
-                self._config = json.load(f)
+            self._config = load_config_file(user_file)
         elif default_file.exists():
-            with open(default_file, encoding="utf-8") as f:
-                self._config = json.load(f)
+            self._config = load_config_file(default_file)
 
     def _load_workflow_models(self) -> None:
         """Load workflow_models.json from data/ (Git source only)."""
@@ -78,20 +194,20 @@ class WorkflowManagerAddon(BaseAddon):
 
         git_file = self.DATA_DIR / "workflow_models.json"
         if git_file.exists():
-            with open(git_file, encoding="utf-8") as f:
-                self._workflow_models = json.load(f)
+            self._workflow_models = load_file(git_file)
+        self._dirty = False
 
     def _save_workflow_models(self) -> str:
-        """Save workflow_models directly to data/ (Git source)."""
-        git_file = self.DATA_DIR / "workflow_models.json"
-        with open(git_file, "w", encoding="utf-8") as f:
-            json.dump(self._workflow_models, f, indent=2, ensure_ascii=False)
+        """Save workflow_models directly to data/ (Git source), if changed."""
+        if not self._dirty:
+            return "No changes (data/workflow_models.json)"
+
+        dump_file(self.DATA_DIR / "workflow_models.json", self._workflow_models)
+        self._dirty = False
 
         return "Saved (data/workflow_models.json)"
 
     def _detect_paths(self) -> None:
-        import os
-
         paths_config = self._config.get("paths", {})
 
         if os.path.exists("/workspace"):
@@ -115,9 +231,11 @@ class WorkflowManagerAddon(BaseAddon):
             if os.path.exists(wf_path):
                 self._workflows_path = Path(wf_path)
 
+        self._paths_detected = True
+
     def get_target_folders(self) -> list[str]:
         """Get list of target folders from JSON."""
-        return self._workflow_models.get("target_folders", [])
+        return self._workflow_models["target_folders"]
 
     def _is_allowed_folder(self, target_path: str) -> bool:
         """Check if target_path is in allowed folders whitelist."""
@@ -125,15 +243,12 @@ class WorkflowManagerAddon(BaseAddon):
             return False
 
         # Direct match
-        if target_path in self.ALLOWED_FOLDERS:
+        if target_path in self._ALLOWED_PREFIXES:
             return True
 
         # Check if it's a subfolder of an allowed folder
-        for folder in self.ALLOWED_FOLDERS:
-            if target_path.startswith(folder + "/"):
-                return True
-
-        return False
+        path = PurePosixPath(target_path)
+        return any(str(parent) in self._ALLOWED_PREFIXES for parent in (path, *path.parents))
 
     def add_target_folder(self, folder: str) -> tuple[str, list[str]]:
         """Add a new target folder."""
@@ -146,21 +261,20 @@ class WorkflowManagerAddon(BaseAddon):
             allowed = ", ".join(sorted(self.ALLOWED_FOLDERS))
             return f"Security: '{folder}' not allowed. Valid: {allowed}", self.get_target_folders()
 
-        folders = self._workflow_models.get("target_folders", [])
+        folders = self._workflow_models["target_folders"]
         if folder not in folders:
-            folders.append(folder)
-            folders.sort()
-            self._workflow_models["target_folders"] = folders
+            bisect.insort(folders, folder)
+            self._dirty = True
             self._save_workflow_models()
             return f"Added '{folder}'", folders
         return f"'{folder}' already exists", folders
 
     def remove_target_folder(self, folder: str) -> tuple[str, list[str]]:
         """Remove a target folder."""
-        folders = self._workflow_models.get("target_folders", [])
+        folders = self._workflow_models["target_folders"]
         if folder in folders:
             folders.remove(folder)
-            self._workflow_models["target_folders"] = folders
+            self._dirty = True
             self._save_workflow_models()
             return f"Removed '{folder}'", folders
         return f"'{folder}' not found", folders
@@ -171,14 +285,45 @@ class WorkflowManagerAddon(BaseAddon):
             return []
 
         pattern = self._config.get("workflow_pattern", "gc*.json")
-        result = []
+        workflows = self._workflow_models["workflows"]
+
+        return sorted(
+            ((wf_id, wf_id in workflows) for wf_id in self._list_workflow_ids(pattern)),
+            key=lambda x: (not x[1], x[0]),
+        )
+
+    def scan_workflow_choices(self) -> list[tuple[str, str]]:
+        """Dropdown (label, workflow_id) choices, rebuilt only when the scan result changes."""
+        key = tuple(self.scan_workflows())
+        cached = self._choices_cache
+        if cached and cached[0] == key:
+            return cached[1]
+
+        choices = [(f"{'✅' if in_json else '⚠️'} {wf_id}", wf_id) for wf_id, in_json in key]
+        self._choices_cache = (key, choices)
+        return choices
+
+    def _list_workflow_ids(self, pattern: str) -> list[str]:
+        """List workflow ids matching pattern, re-reading the directory only if it changed."""
+        try:
+            mtime_ns = self._workflows_path.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        cached = self._scan_cache
+        if cached and cached[0] == mtime_ns and cached[1] == pattern:
+            return cached[2]
 
-        for wf_file in self._workflows_path.glob(pattern):
-            wf_id = wf_file.stem
-            is_in_json = wf_id in self._workflow_models.get("workflows", {})
-            result.append((wf_id, is_in_json))
+        if self._pattern_re is None or self._pattern_re[0] != pattern:
+            self._pattern_re = (pattern, re.compile(fnmatch.translate(pattern)))
+        match = self._pattern_re[1].match
 
-        return sorted(result, key=lambda x: (not x[1], x[0]))
+        # Plain names from scandir, no Path objects per entry
+        with os.scandir(self._workflows_path) as entries:
+            wf_ids = [os.path.splitext(e.name)[0] for e in entries if match(e.name) and e.is_file()]
+
+        self._scan_cache = (mtime_ns, pattern, wf_ids)
+        return wf_ids
 
     def get_models_table(self, workflow_id: str) -> list[list[Any]]:
         """Get models table for a workflow.
@@ -186,28 +331,31 @@ class WorkflowManagerAddon(BaseAddon):
         Returns: [Dateiname, Ordner, MB, S, M, L, URL]
         S=8-12GB, M=16GB, L=24-32GB
         """
-        wf = self._workflow_models.get("workflows", {}).get(workflow_id, {})
-        model_sets = wf.get("model_sets", {})
-        all_models = self._workflow_models.get("models", {})
+        return list(self._iter_models_rows(workflow_id))
 
-        if not model_sets:
-            return []
+    def _iter_models_rows(self, workflow_id: str) -> Iterator[list[Any]]:
+        """Yield stored model rows of a workflow, sorted by model_id."""
+        workflows = self._workflow_models["workflows"]
+        all_models = self._workflow_models["models"]
+        model_sets = workflows.get(workflow_id, {}).get("model_sets", {})
 
         # Collect model_ids and their VRAM assignments
-        model_vram_map = {}  # model_id -> set of VRAM values
-
-        for set_name, set_data in model_sets.items():
-            vram = set_data.get("vram_gb", 0)
+        model_vram_map = {}  # model_id -> bitmask of VRAM values (bit v = v GB)
+
+        get_mask = model_vram_map.get
+        for set_data in model_sets.values():
+            try:
+                vram = int(set_data.get("vram_gb", 0))
+            except (TypeError, ValueError):
+                vram = -1
+            # Values no tier contains (negative, non-numeric, huge) set no bit
+            bit = 1 << vram if 0 <= vram <= self._MAX_TIER_VRAM else 0
             for mid in set_data.get("models", []):
-                if mid not in model_vram_map:
-                    model_vram_map[mid] = set()
-                model_vram_map[mid].add(vram)
+                model_vram_map[mid] = get_mask(mid, 0) | bit
 
-        # Build table
-        table = []
-        for mid in sorted(model_vram_map.keys()):
+        tier_masks = tuple(self._TIER_MASKS.values())  # S, M, L
+        for mid, mask in sorted(model_vram_map.items()):
             model = all_models.get(mid, {})
-            vrams = model_vram_map[mid]
 
             row = [
                 model.get("filename", mid),
@@ -215,119 +363,120 @@ class WorkflowManagerAddon(BaseAddon):
                 model.get("size_mb", 0),
             ]
             # Add VRAM tier checkboxes (S, M, L)
-            for tier, tier_vrams in self.VRAM_TIERS.items():
-                row.append(any(v in vrams for v in tier_vrams))
+            row.extend(bool(mask & tier_mask) for tier_mask in tier_masks)
             row.append(model.get("url", ""))
-            table.append(row)
-
-        return table
+            yield row
 
     def parse_workflow_to_table(self, workflow_id: str) -> list[list[Any]]:
         """Parse workflow and return table with URL suggestions."""
+        return list(self._iter_parsed_rows(workflow_id))
+
+    def _iter_parsed_rows(self, workflow_id: str) -> Iterator[list[Any]]:
+        """Yield one row per model referenced by the workflow file."""
         if not self._workflows_path:
-            return []
+            return
 
-        wf_path = self._workflows_path / f"{workflow_id}.json"
-        parsed_models = parse_workflow(wf_path)
+        parsed_models = parse_workflow(self._workflows_path / f"{workflow_id}.json")
 
-        table = []
+        tier_defaults = [True] * len(self.VRAM_TIERS)
         for pm in parsed_models:
             known = suggest_url(pm.filename)
-            row = [
+            # Default: all tiers checked (S, M, L)
+            yield [
                 pm.filename,
                 pm.target_path,
                 known.size_mb if known else 0,
+                *tier_defaults,
+                known.url if known else "",
             ]
-            # Default: all tiers checked (S, M, L)
-            for _ in self.VRAM_TIERS:
-                row.append(True)
-            row.append(known.url if known else "")
-            table.append(row)
-
-        return table
 
     def save_workflow(
         self,
         workflow_id: str,
-        table_data: list[list[Any]],
+        table_data: "list[list[Any]] | pd.DataFrame",
     ) -> str:
-        """Save workflow from table data."""
+        """Save workflow from table data (list of rows or gr.Dataframe DataFrame)."""
         if not workflow_id:
             return "No workflow selected"
 
-        # Ensure structures exist
-        if "workflows" not in self._workflow_models:
-            self._workflow_models["workflows"] = {}
-        if "models" not in self._workflow_models:
-            self._workflow_models["models"] = {}
+        workflows = self._workflow_models["workflows"]
+        models = self._workflow_models["models"]
 
         # Create/update workflow
-        if workflow_id not in self._workflow_models["workflows"]:
-            self._workflow_models["workflows"][workflow_id] = {
+        if workflow_id not in workflows:
+            workflows[workflow_id] = {
                 "name": workflow_id,
                 "description": "",
                 "category": "video" if "gcv" in workflow_id else "image",
                 "model_sets": {},
             }
+            self._dirty = True
 
-        wf = self._workflow_models["workflows"][workflow_id]
+        wf = workflows[workflow_id]
+        old_model_sets = wf.get("model_sets", {})
         wf["model_sets"] = {}
 
         # Table format: [filename, folder, mb, S, M, L, url]
         # S=8-12GB, M=16GB, L=24-32GB
         tier_to_models = {tier: [] for tier in self.VRAM_TIERS}
+        tier_lists = list(tier_to_models.values())  # S, M, L
 
-        for row in table_data:
-            if len(row) < 7 or not row[0]:
-                continue
-
-            filename = str(row[0]).strip()
-            target_path = str(row[1]).strip() if row[1] else ""
-            size_mb = int(row[2]) if row[2] else 0
-
-            # VRAM tier checkboxes at index 3-5 (S, M, L)
-            tier_checks = row[3:6]
-            url = str(row[6]).strip() if len(row) > 6 and row[6] else ""
+        if pd is not None and isinstance(table_data, pd.DataFrame):
+            rows = _rows_from_frame(table_data)
+        else:
+            rows = _rows_from_lists(table_data)
 
+        # tier_checks: VRAM tier checkboxes (S, M, L)
+        for filename, target_path, size_mb, tier_checks, url in rows:
             if not filename:
                 continue
 
             # Generate model_id with collision detection
-            base_model_id = filename.replace(".", "_").replace("-", "_").lower()
+            base_model_id = filename.translate(_MODEL_ID_TRANS)
+            if not base_model_id.isascii():
+                base_model_id = base_model_id.lower()  # non-ASCII uppercase
             model_id = base_model_id
 
             # Check for collision - if existing model has different filename, add suffix
-            existing = self._workflow_models["models"].get(model_id)
+            existing = models.get(model_id)
             if existing and existing.get("filename") != filename:
                 # Collision detected - append target_path hash to make unique
                 suffix = target_path.replace("/", "_").replace(".", "_")
                 model_id = f"{base_model_id}_{suffix}"
 
             # Save model definition
-            self._workflow_models["models"][model_id] = {
+            model_def = {
                 "name": filename,
                 "filename": filename,
                 "url": url,
                 "target_path": target_path,
                 "size_mb": size_mb,
             }
-
-            # Add to tier sets based on checkboxes
-            for i, tier in enumerate(self.VRAM_TIERS.keys()):
-                if i < len(tier_checks) and tier_checks[i]:
-                    tier_to_models[tier].append(model_id)
-
-        # Create model sets - expand tiers to actual VRAM values
+            if models.get(model_id) != model_def:
+                models[model_id] = model_def
+                self._dirty = True
+
+            # Add to tier sets based on checkboxes (rows may carry fewer tier columns)
+            for model_ids, checked in zip(tier_lists, tier_checks, strict=False):
+                if checked:
+                    model_ids.append(model_id)
+
+        # Create model sets - expand tiers to actual VRAM values.
+        # All sets of a tier share one models list; the file format stays per-VRAM
+        # because Model Depot reads model_sets by vram_gb.
+        model_sets = wf["model_sets"]
         for tier, model_ids in tier_to_models.items():
-            if model_ids:
-                vram_values = self.VRAM_TIERS[tier]
-                for vram in vram_values:
-                    set_name = f"{vram}GB"
-                    wf["model_sets"][set_name] = {
-                        "name": f"{vram}GB VRAM",
-                        "vram_gb": vram,
-                        "models": model_ids,
-                    }
+            if not model_ids:
+                continue
+            for vram in self.VRAM_TIERS[tier]:
+                model_sets[f"{vram}GB"] = {
+                    "name": f"{vram}GB VRAM",
+                    "vram_gb": vram,
+                    "models": model_ids,
+                }
+
+        if wf["model_sets"] != old_model_sets:
+            self._dirty = True
 
         return self._save_workflow_models()
 
@@ -344,15 +493,9 @@ class WorkflowManagerAddon(BaseAddon):
 
             # === Workflow Selection ===
             with gr.Row():
-                workflow_list = self.scan_workflows()
-                wf_choices = [
-                    (f"{'✅' if in_json else '⚠️'} {wf_id}", wf_id)
-                    for wf_id, in_json in workflow_list
-                ]
-
                 workflow_dropdown = gr.Dropdown(
                     label="Workflow",
-                    choices=wf_choices,
+                    choices=self.scan_workflow_choices(),
                     value=None,
                     scale=3,
                 )
@@ -422,18 +565,16 @@ class WorkflowManagerAddon(BaseAddon):
             # === Event Handlers ===
 
             def on_scan():
-                workflow_list = self.scan_workflows()
-                choices = [
-                    (f"{'✅' if in_json else '⚠️'} {wf_id}", wf_id)
-                    for wf_id, in_json in workflow_list
-                ]
-                return gr.update(choices=choices)
+                return gr.update(choices=self.scan_workflow_choices())
 
             def on_workflow_select(wf_id):
                 if not wf_id:
                     return [], wf_id
 
-                table = self.get_models_table(wf_id)
+                # Only workflows already in JSON can have a stored table
+                table = []
+                if wf_id in self._workflow_models["workflows"]:
+                    table = self.get_models_table(wf_id)
                 if not table:
                     table = self.parse_workflow_to_table(wf_id)
 
@@ -467,25 +608,25 @@ class WorkflowManagerAddon(BaseAddon):
                 return table_data
 
             def on_save(wf_id, table_data):
-                if hasattr(table_data, "values"):
-                    table_data = table_data.values.tolist()
                 return self.save_workflow(wf_id, table_data)
 
             def on_add_folder(folder_name):
                 msg, folders = self.add_target_folder(folder_name)
+                rows, choices = _folders_ui_state(tuple(folders))
                 return (
                     msg,
-                    [[f] for f in folders],
-                    gr.update(choices=folders),
+                    rows,
+                    gr.update(choices=choices),
                     "",
                 )
 
             def on_del_folder(folder_name):
                 msg, folders = self.remove_target_folder(folder_name)
+                rows, choices = _folders_ui_state(tuple(folders))
                 return (
                     msg,
-                    [[f] for f in folders],
-                    gr.update(choices=folders, value=None),
+                    rows,
+                    gr.update(choices=choices, value=None),
                 )
 
             # === Wire Events ===
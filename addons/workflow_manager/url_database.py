@@ -1,26 +1,29 @@
 """Known model URLs database for auto-suggestions."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KnownModel:
-    """A known model with URL and metadata."""
+    """A known model with URL and metadata (immutable)."""
 
     name: str
     filename: str
     url: str
     size_mb: int
     target_path: str
-    aliases: list[str] = None  # Alternative filenames
+    aliases: tuple[str, ...] = ()  # Alternative filenames
 
     def __post_init__(self):
-        if self.aliases is None:
-            self.aliases = []
+        # Accept any iterable (e.g. a list) but store a tuple
+        if not isinstance(self.aliases, tuple):
+            object.__setattr__(self, "aliases", tuple(self.aliases or ()))
 
 
 # Database of known models with HuggingFace URLs
-KNOWN_MODELS: dict[str, KnownModel] = {
+_KNOWN_MODELS: dict[str, KnownModel] = {
     # === WAN 2.2 Models ===
     "wan2.2_i2v_720p_14B_bf16.safetensors": KnownModel(
         name="WAN 2.2 14B I2V (bf16)",
@@ -169,25 +172,31 @@ KNOWN_MODELS: dict[str, KnownModel] = {
     ),
 }
 
+# Read-only view exported to callers
+KNOWN_MODELS: Mapping[str, KnownModel] = MappingProxyType(_KNOWN_MODELS)
+
+
+def _build_lookup(models: Mapping[str, KnownModel]) -> dict[str, KnownModel]:
+    """Map lowercased filenames and aliases to models.
+
+    Filenames win over aliases; on collisions the first entry wins.
+    """
+    lookup: dict[str, KnownModel] = {}
+    for key, model in models.items():
+        lookup.setdefault(key.lower(), model)
+    for model in models.values():
+        for alias in model.aliases:
+            lookup.setdefault(alias.lower(), model)
+    return lookup
+
+
+_LOOKUP = _build_lookup(KNOWN_MODELS)
+
 
 def suggest_url(filename: str) -> KnownModel | None:
     """Look up a filename and return known model info if available."""
-    # Direct match
-    if filename in KNOWN_MODELS:
-        return KNOWN_MODELS[filename]
-
-    # Try lowercase
-    filename_lower = filename.lower()
-    for key, model in KNOWN_MODELS.items():
-        if key.lower() == filename_lower:
-            return model
-
-    # Check aliases
-    for key, model in KNOWN_MODELS.items():
-        if filename in model.aliases or filename_lower in [a.lower() for a in model.aliases]:
-            return model
-
-    return None
+    # Direct match first, then case-insensitive filename/alias match
+    return KNOWN_MODELS.get(filename) or _LOOKUP.get(filename.lower())
 
 
 def get_all_known_models() -> list[KnownModel]:
@@ -1,14 +1,17 @@
 """Parse ComfyUI workflow JSON files to extract model references."""
 
-import json
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from core.json_utils import load_file
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ParsedModel:
-    """A model reference found in a workflow."""
+    """A model reference found in a workflow (immutable; parse results are cached)."""
 
     filename: str
     node_type: str
@@ -58,22 +61,37 @@ SECONDARY_INPUTS = {
 def parse_workflow(workflow_path: Path) -> list[ParsedModel]:
     """Parse a ComfyUI workflow and extract all model references.
 
+    Results are cached per (path, mtime, size), so re-parsing an unchanged
+    file is a dict lookup.
+
     Args:
         workflow_path: Path to the workflow JSON file
 
     Returns:
         List of ParsedModel objects found in the workflow
     """
-    if not workflow_path.exists():
+    try:
+        st = workflow_path.stat()
+    except OSError:
         return []
 
+    return list(_parse_workflow_cached(str(workflow_path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=128)
+def _parse_workflow_cached(path_str: str, mtime_ns: int, size: int) -> tuple[ParsedModel, ...]:
+    """Load and parse a workflow file; mtime_ns and size only key the cache."""
     try:
-        with open(workflow_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_file(Path(path_str))
     except Exception as e:
         print(f"[Parser] Error loading workflow: {e}")
-        return []
+        return ()
+
+    return tuple(parse_workflow_from_dict(data))
 
+
+def parse_workflow_from_dict(data: dict[str, Any]) -> list[ParsedModel]:
+    """Parse workflow data already loaded as dict."""
     models: list[ParsedModel] = []
     seen_filenames: set[str] = set()
 
@@ -81,26 +99,29 @@ def parse_workflow(workflow_path: Path) -> list[ParsedModel]:
     # Format 1: {"nodes": [...], "links": [...]} (API format)
     # Format 2: {"1": {...}, "2": {...}} (node dict format)
 
-    nodes = []
+    # (dict key or None, node) pairs; the caller's data is never modified
+    nodes: Iterable[tuple[str | None, dict[str, Any]]] = ()
 
     if "nodes" in data:
         # API format
-        nodes = data["nodes"]
+        nodes = ((None, node) for node in data["nodes"])
     elif isinstance(data, dict):
         # Node dict format - check for numbered keys
-        for key, value in data.items():
-            if isinstance(value, dict) and "class_type" in value:
-                value["_node_id"] = key
-                nodes.append(value)
-
-    for node in nodes:
-        node_type = node.get("class_type", node.get("type", ""))
-        node_id = str(node.get("_node_id", node.get("id", "?")))
-
-        if node_type not in MODEL_LOADER_NODES:
+        nodes = (
+            (key, value)
+            for key, value in data.items()
+            if isinstance(value, dict) and "class_type" in value
+        )
+
+    for key, node in nodes:
+        # Most nodes are not loaders: decide on the type before reading anything else
+        node_type = node.get("class_type") or node.get("type")
+        loader = MODEL_LOADER_NODES.get(node_type)
+        if loader is None:
             continue
 
-        input_name, target_path = MODEL_LOADER_NODES[node_type]
+        input_name, target_path = loader
+        node_id = key if key is not None else str(node.get("id", "?"))
 
         # Get inputs - can be in "inputs" or "widgets_values"
         inputs = node.get("inputs", {})
@@ -110,17 +131,19 @@ def parse_workflow(workflow_path: Path) -> list[ParsedModel]:
         filename = None
 
         # Check inputs dict
-        if isinstance(inputs, dict) and input_name in inputs:
+        # Exact type checks: parsed JSON only yields plain str/list/dict
+        if type(inputs) is dict and input_name in inputs:
             val = inputs[input_name]
-            if isinstance(val, str):
+            val_type = type(val)
+            if val_type is str:
                 filename = val
-            elif isinstance(val, list) and len(val) > 0:
+            elif val_type is list and val:
                 filename = str(val[0])
 
         # Check widgets_values (positional)
-        if not filename and widgets:
-            # First widget is usually the model name
-            if len(widgets) > 0 and isinstance(widgets[0], str):
+        if not filename and type(widgets) is list and widgets:
+            # First widget is usually the model name (dict-style widgets are skipped)
+            if type(widgets[0]) is str:
                 filename = widgets[0]
 
         if filename and filename not in seen_filenames:
@@ -136,80 +159,24 @@ def parse_workflow(workflow_path: Path) -> list[ParsedModel]:
             )
 
         # Check secondary inputs
-        if node_type in SECONDARY_INPUTS:
-            for sec_input, sec_path in SECONDARY_INPUTS[node_type]:
-                sec_filename = None
-
-                if isinstance(inputs, dict) and sec_input in inputs:
-                    val = inputs[sec_input]
-                    if isinstance(val, str):
-                        sec_filename = val
-
-                if sec_filename and sec_filename not in seen_filenames:
-                    seen_filenames.add(sec_filename)
-                    models.append(
-                        ParsedModel(
-                            filename=sec_filename,
-                            node_type=node_type,
-                            node_id=node_id,
-                            input_name=sec_input,
-                            target_path=sec_path,
-                        )
+        for sec_input, sec_path in SECONDARY_INPUTS.get(node_type, ()):
+            sec_filename = None
+
+            if type(inputs) is dict and sec_input in inputs:
+                val = inputs[sec_input]
+                if type(val) is str:
+                    sec_filename = val
+
+            if sec_filename and sec_filename not in seen_filenames:
+                seen_filenames.add(sec_filename)
+                models.append(
+                    ParsedModel(
+                        filename=sec_filename,
+                        node_type=node_type,
+                        node_id=node_id,
+                        input_name=sec_input,
+                        target_path=sec_path,
                     )
-
-    return models
-
-
-def parse_workflow_from_dict(data: dict[str, Any]) -> list[ParsedModel]:
-    """Parse workflow data already loaded as dict."""
-    # Same logic as parse_workflow but takes dict directly
-    models: list[ParsedModel] = []
-    seen_filenames: set[str] = set()
-
-    nodes = []
-
-    if "nodes" in data:
-        nodes = data["nodes"]
-    elif isinstance(data, dict):
-        for key, value in data.items():
-            if isinstance(value, dict) and "class_type" in value:
-                value["_node_id"] = key
-                nodes.append(value)
-
-    for node in nodes:
-        node_type = node.get("class_type", node.get("type", ""))
-        node_id = str(node.get("_node_id", node.get("id", "?")))
-
-        if node_type not in MODEL_LOADER_NODES:
-            continue
-
-        input_name, target_path = MODEL_LOADER_NODES[node_type]
-        inputs = node.get("inputs", {})
-        widgets = node.get("widgets_values", [])
-
-        filename = None
-
-        if isinstance(inputs, dict) and input_name in inputs:
-            val = inputs[input_name]
-            if isinstance(val, str):
-                filename = val
-            elif isinstance(val, list) and len(val) > 0:
-                filename = str(val[0])
-
-        if not filename and widgets:
-            if len(widgets) > 0 and isinstance(widgets[0], str):
-                filename = widgets[0]
-
-        if filename and filename not in seen_filenames:
-            seen_filenames.add(filename)
-            models.append(
-                ParsedModel(
-                    filename=filename,
-                    node_type=node_type,
-                    node_id=node_id,
-                    input_name=input_name,
-                    target_path=target_path,
                 )
-            )
 
     return models
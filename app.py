@@ -15,18 +15,21 @@ Environment Variables:
 import argparse
 import json
 import os
+import socket
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import gradio as gr
+# gradio and core (which imports gradio) are loaded in create_app()/main(),
+# so `--help` and argument errors return without paying gradio's import time
+if TYPE_CHECKING:
+    import gradio as gr
 
-from core.addon_loader import AddonLoader
-from core.config_manager import ConfigManager
-from core.profile_sync import ProfileSyncService
+    from core.config_manager import ConfigManager
 
 # === Settings Store ===
 
@@ -34,22 +37,41 @@ SETTINGS_DIR = Path(__file__).parent / ".config"
 SETTINGS_FILE = SETTINGS_DIR / "app_settings.json"
 
 
+# (settings file, mtime_ns, parsed settings) of the last load/save
+_settings_cache: tuple[Path, int, dict] | None = None
+
+
 def _load_app_settings() -> dict:
-    """Load app settings from file."""
-    if SETTINGS_FILE.exists():
-        try:
-            with open(SETTINGS_FILE, encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
-            pass
-    return {}
+    """Load app settings from file (cached until the file changes)."""
+    from core.json_utils import load_file
+
+    global _settings_cache
+    try:
+        mtime_ns = SETTINGS_FILE.stat().st_mtime_ns
+    except OSError:
+        return {}
+
+    cached = _settings_cache
+    if cached and cached[0] == SETTINGS_FILE and cached[1] == mtime_ns:
+        return dict(cached[2])
+
+    try:
+        settings = load_file(SETTINGS_FILE)
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+    _settings_cache = (SETTINGS_FILE, mtime_ns, settings)
+    return dict(settings)
 
 
 def _save_app_settings(settings: dict) -> None:
     """Save app settings to file."""
+    from core.json_utils import dump_file
+
+    global _settings_cache
     SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=2, ensure_ascii=False)
+    dump_file(SETTINGS_FILE, settings)
+    _settings_cache = (SETTINGS_FILE, SETTINGS_FILE.stat().st_mtime_ns, dict(settings))
 
 
 def is_disclaimer_accepted() -> bool:
@@ -148,7 +170,7 @@ damages, losses, or expenses (including legal fees) arising from:
 # === Disk Info ===
 
 
-def _get_disk_info(config: ConfigManager) -> str:
+def _get_disk_info(config: "ConfigManager") -> str:
     """Get disk space info for relevant paths."""
     import shutil
 
@@ -198,7 +220,7 @@ def _get_disk_info(config: ConfigManager) -> str:
     return "\n            ".join(lines) if lines else "No paths configured"
 
 
-def detect_release(config: ConfigManager) -> str:
+def detect_release(config: "ConfigManager") -> str:
     """Auto-detect which release to load based on environment."""
     # Check environment variable first
     env_release = os.environ.get("TOOLKIT_RELEASE", "").lower()
@@ -214,10 +236,38 @@ def detect_release(config: ConfigManager) -> str:
     return "full"
 
 
-def create_app(release: str, profile_url: str = "") -> gr.Blocks:
+def _bind_port(port: int) -> int | None:
+    """Bind port (0 = any) and return the bound port number, or None if it is in use."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("", port))
+            return s.getsockname()[1]
+    except OSError:
+        return None
+
+
+def find_free_port(start_port: int, max_attempts: int = 10) -> int | None:
+    """Find a free port, preferring start_port and the ports just above it.
+
+    A start_port of 0, or a fully occupied range, yields an OS-assigned port.
+    Returns None if not even an OS-assigned port could be bound.
+    """
+    if start_port:
+        for port in range(start_port, start_port + max_attempts):
+            if _bind_port(port) is not None:
+                return port
+    return _bind_port(0)
+
+
+def create_app(release: str, profile_url: str = "") -> "gr.Blocks":
     """Create the Gradio app with loaded addons."""
+    import gradio as gr
+
+    from core.addon_loader import AddonLoader
+    from core.config_manager import get_config_manager
+    from core.profile_sync import ProfileSyncService
 
-    config = ConfigManager()
+    config = get_config_manager()
     loader = AddonLoader()
     profile_sync = ProfileSyncService(profile_url)
 
@@ -349,7 +399,7 @@ def main():
         "-p",
         type=int,
         default=7861,
-        help="Port to run on (default: 7861)",
+        help="Port to run on (default: 7861, 0 = any free port)",
     )
     parser.add_argument(
         "--profile-url",
@@ -364,8 +414,12 @@ def main():
 
     args = parser.parse_args()
 
-    # Initialize config
-    config = ConfigManager()
+    import gradio as gr
+
+    from core.config_manager import get_config_manager
+
+    # Initialize config (shared with create_app)
+    config = get_config_manager()
 
     # Determine release
     release = args.release or detect_release(config)
@@ -396,21 +450,10 @@ def main():
         launch_kwargs["share"] = True  # Colab needs share for public access
         print("[Toolkit] Colab mode: server_name=0.0.0.0, share=True")
 
-    # Try to find an available port
-    import socket
-
-    def find_free_port(start_port: int, max_attempts: int = 10) -> int:
-        for port in range(start_port, start_port + max_attempts):
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind(("", port))
-                    return port
-            except OSError:
-                continue
-        return start_port + max_attempts
-
     port = find_free_port(args.port)
-    if port != args.port:
+    if port is None:
+        print("[Toolkit] No free port found, letting Gradio pick one")
+    elif args.port and port != args.port:
         print(f"[Toolkit] Port {args.port} in use, using port {port}")
     launch_kwargs["server_port"] = port
 
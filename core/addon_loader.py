@@ -1,11 +1,15 @@
 """Addon loader with release profile support."""
 
 import importlib
-import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from core.base_addon import BaseAddon
+from core.json_utils import load_file, loads
 
 
 class AddonLoader:
@@ -18,30 +22,38 @@ class AddonLoader:
     """
 
     ADDONS_DIR = Path(__file__).parent.parent / "addons"
+    _PACKAGE_ADDONS_DIR = ADDONS_DIR  # importable as the "addons" package
+    LOAD_WORKERS = 4
     RELEASES_DIR = Path(__file__).parent.parent / "config" / "releases"
 
     def __init__(self):
         self._loaded_addons: dict[str, BaseAddon] = {}
+        self._lock = threading.Lock()  # guards _loaded_addons during parallel loads
         self._release_config: dict[str, Any] | None = None
 
     def get_available_releases(self) -> list[str]:
         """Get list of available release configurations."""
-        releases = []
-        if self.RELEASES_DIR.exists():
-            for f in self.RELEASES_DIR.glob("*.json"):
-                releases.append(f.stem)
-        return sorted(releases)
+        try:
+            with os.scandir(self.RELEASES_DIR) as entries:
+                return sorted(
+                    e.name[:-5] for e in entries if e.name.endswith(".json") and e.is_file()
+                )
+        except FileNotFoundError:
+            return []
 
     def get_available_addons(self) -> list[str]:
         """Scan addons directory for available addons."""
-        addons = []
-        if self.ADDONS_DIR.exists():
-            for d in self.ADDONS_DIR.iterdir():
-                if d.is_dir() and not d.name.startswith("_"):
-                    addon_file = d / "addon.py"
-                    if addon_file.exists():
-                        addons.append(d.name)
-        return sorted(addons)
+        try:
+            with os.scandir(self.ADDONS_DIR) as entries:
+                return sorted(
+                    e.name
+                    for e in entries
+                    if not e.name.startswith("_")
+                    and e.is_dir()
+                    and os.path.isfile(os.path.join(e.path, "addon.py"))
+                )
+        except FileNotFoundError:
+            return []
 
     def load_release_config(self, release_name: str) -> dict[str, Any]:
         """Load release configuration from file or URL."""
@@ -54,8 +66,7 @@ class AddonLoader:
         if not config_path.exists():
             raise FileNotFoundError(f"Release config not found: {config_path}")
 
-        with open(config_path, encoding="utf-8") as f:
-            self._release_config = json.load(f)
+        self._release_config = load_file(config_path)
 
         return self._release_config
 
@@ -70,16 +81,16 @@ class AddonLoader:
 
         try:
             with urllib.request.urlopen(url, context=ctx, timeout=10) as response:
-                content = response.read().decode("utf-8")
-                self._release_config = json.loads(content)
+                self._release_config = loads(response.read())
                 return self._release_config
         except Exception as e:
             raise RuntimeError(f"Failed to load remote config from {url}: {e}")
 
     def load_addon(self, addon_id: str) -> BaseAddon | None:
         """Load a single addon by ID."""
-        if addon_id in self._loaded_addons:
-            return self._loaded_addons[addon_id]
+        with self._lock:
+            if addon_id in self._loaded_addons:
+                return self._loaded_addons[addon_id]
 
         addon_path = self.ADDONS_DIR / addon_id / "addon.py"
         if not addon_path.exists():
@@ -87,10 +98,7 @@ class AddonLoader:
             return None
 
         try:
-            # Dynamic import
-            spec = importlib.util.spec_from_file_location(f"addons.{addon_id}.addon", addon_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            module = self._import_addon_module(addon_id, addon_path)
 
             # Find the addon class (must end with "Addon")
             addon_class = None
@@ -107,7 +115,8 @@ class AddonLoader:
             # Instantiate and register
             addon = addon_class()
             addon.on_load()
-            self._loaded_addons[addon_id] = addon
+            with self._lock:
+                self._loaded_addons[addon_id] = addon
             print(f"Loaded addon: {addon.name} ({addon_id})")
             return addon
 
@@ -115,30 +124,60 @@ class AddonLoader:
             print(f"Error loading addon {addon_id}: {e}")
             return None
 
-    def load_release(self, release_name: str) -> list[BaseAddon]:
-        """Load all addons for a release configuration."""
-        config = self.load_release_config(release_name)
-        addons = []
-
-        for addon_cfg in config.get("addons", []):
-            addon_id = addon_cfg.get("id")
-            enabled = addon_cfg.get("enabled", True)
+    def _import_addon_module(self, addon_id: str, addon_path: Path):
+        """Import addon.py once and register it in sys.modules."""
+        module_name = f"addons.{addon_id}.addon"
+        module = sys.modules.get(module_name)
+        if module is not None and Path(module.__file__) == addon_path:
+            return module
+
+        if self.ADDONS_DIR == self._PACKAGE_ADDONS_DIR:
+            # Regular import: the addon package __init__ imports .addon itself,
+            # so loading the file separately would create a second module copy
+            return importlib.import_module(module_name)
+
+        # Addons outside the package directory: load from file under the same name
+        spec = importlib.util.spec_from_file_location(module_name, addon_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+        return module
 
-            if enabled and addon_id:
-                addon = self.load_addon(addon_id)
-                if addon:
-                    addons.append(addon)
+    def load_release(self, release_name: str) -> list[BaseAddon]:
+        """Load all addons for a release configuration.
 
-        return addons
+        Addons are imported in parallel (module imports and on_load() I/O
+        overlap); the result keeps the order of the release config.
+        """
+        config = self.load_release_config(release_name)
+        addon_ids = [
+            cfg["id"]
+            for cfg in config.get("addons", [])
+            if cfg.get("enabled", True) and cfg.get("id")
+        ]
+        unique_ids = list(dict.fromkeys(addon_ids))
+
+        if len(unique_ids) > 1:
+            workers = min(self.LOAD_WORKERS, len(unique_ids))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="addon-load") as pool:
+                loaded = dict(zip(unique_ids, pool.map(self.load_addon, unique_ids), strict=True))
+        else:
+            loaded = {addon_id: self.load_addon(addon_id) for addon_id in unique_ids}
+
+        return [loaded[addon_id] for addon_id in addon_ids if loaded[addon_id]]
 
     def unload_addon(self, addon_id: str) -> bool:
         """Unload an addon."""
-        if addon_id not in self._loaded_addons:
+        with self._lock:
+            addon = self._loaded_addons.pop(addon_id, None)
+        if addon is None:
             return False
 
-        addon = self._loaded_addons[addon_id]
         addon.on_unload()
-        del self._loaded_addons[addon_id]
         return True
 
     def get_loaded_addons(self) -> list[BaseAddon]:
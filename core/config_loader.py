@@ -0,0 +1,31 @@
+"""Shared reader for config.json files.
+
+ConfigManager, ssl_utils, the updater and several addons all read the same
+config.json at startup. load_config_file() parses each file once and hands
+out the same object until the file changes on disk.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from core.json_utils import load_file
+
+
+@lru_cache(maxsize=8)
+def _load_cached(path: Path, mtime_ns: int, size: int) -> Any:
+    """Parse path; mtime_ns and size only key the cache."""
+    return load_file(path)
+
+
+def load_config_file(path: Path) -> Any:
+    """Load a JSON config file, reusing the parsed result while it is unchanged.
+
+    The returned object is shared between callers and must not be modified.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    st = path.stat()
+    return _load_cached(path, st.st_mtime_ns, st.st_size)
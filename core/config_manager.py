@@ -1,10 +1,42 @@
 """Configuration manager for toolkit settings."""
 
-import json
+import atexit
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
+from core.config_loader import load_config_file
+from core.json_utils import dump_file, load_file
+
+# Common ComfyUI install locations, checked in order by detect_comfyui_path()
+_COMMON_COMFYUI_PATHS: tuple[Path, ...] = (
+    # Local common paths
+    Path.home() / "ComfyUI",
+    Path("/workspace/ComfyUI"),  # RunPod
+    Path("/content/ComfyUI"),  # Colab
+    Path("C:/ComfyUI"),  # Windows
+    Path("D:/ComfyUI"),
+    # Relative
+    Path("../ComfyUI"),
+    Path("../../ComfyUI"),
+)
+
+# Managers with unsaved setting changes; written out by flush() or at exit
+_DIRTY: set["ConfigManager"] = set()
+_DIRTY_LOCK = threading.Lock()
+
+
+def _flush_all() -> None:
+    """Save every ConfigManager that still has pending changes."""
+    with _DIRTY_LOCK:
+        managers = list(_DIRTY)
+    for manager in managers:
+        manager.flush()
+
+
+atexit.register(_flush_all)
+
 
 class ConfigManager:
     """Manage toolkit configuration.
@@ -32,17 +64,19 @@ class ConfigManager:
     }
 
     def __init__(self):
+        # Resolved once so a deferred flush writes where settings were loaded from
+        self._settings_file = self.SETTINGS_FILE
         self._settings: dict[str, Any] = {}
-        self._config: dict[str, Any] = {}  # Main config.json
+        self._config: dict[str, Any] | None = None  # Main config.json, loaded on first use
+        # Environment/path detection results; cleared by invalidate_paths()
+        self._env_cache: dict[str, Any] = {}
         self._load_settings()
-        self._load_config()
 
     def _load_settings(self) -> None:
         """Load settings from file or create defaults."""
-        if self.SETTINGS_FILE.exists():
+        if self._settings_file.exists():
             try:
-                with open(self.SETTINGS_FILE, encoding="utf-8") as f:
-                    self._settings = json.load(f)
+                self._settings = load_file(self._settings_file)
             except Exception:
                 self._settings = self.DEFAULT_SETTINGS.copy()
         else:
@@ -51,72 +85,88 @@ class ConfigManager:
 
     def _save_settings(self) -> None:
         """Save settings to file."""
-        self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(self.SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(self._settings, f, indent=2, ensure_ascii=False)
+        self._settings_file.parent.mkdir(parents=True, exist_ok=True)
+        dump_file(self._settings_file, self._settings)
+
+    def _mark_dirty(self) -> None:
+        """Schedule the settings for saving on the next flush."""
+        with _DIRTY_LOCK:
+            _DIRTY.add(self)
+
+    def flush(self) -> None:
+        """Write pending setting changes to disk (no-op if nothing changed)."""
+        with _DIRTY_LOCK:
+            if self not in _DIRTY:
+                return
+            _DIRTY.discard(self)
+        self._save_settings()
 
-    def _load_config(self) -> None:
+    def _load_config(self) -> dict[str, Any]:
         """Load main config.json (same as addons use)."""
         # Priority: .config/config.json > config/config.json
         user_file = self.USER_CONFIG_DIR / "config.json"
         default_file = self.CONFIG_DIR / "config.json"
 
-        if user_file.exists():
-            try:
-                with open(user_file, encoding="utf-8") as f:
-                    self._config = json.load(f)
-            except Exception:
-                self._config = {}
-        elif default_file.exists():
-            try:
-                with open(default_file, encoding="utf-8") as f:
-                    self._config = json.load(f)
-            except Exception:
-                self._config = {}
+        for config_file in (user_file, default_file):
+            if config_file.exists():
+                try:
+                    return load_config_file(config_file)
+                except Exception:
+                    return {}
+        return {}
+
+    def _get_config(self) -> dict[str, Any]:
+        """Return config.json, reading it on first use."""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a setting value."""
         return self._settings.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        """Set a setting value and save."""
+        """Set a setting value; saved on flush() or at interpreter exit."""
         self._settings[key] = value
-        self._save_settings()
+        self._mark_dirty()
 
     def get_all(self) -> dict[str, Any]:
         """Get all settings."""
         return self._settings.copy()
 
     def reset(self) -> None:
-        """Reset to default settings."""
+        """Reset to default settings; saved on flush() or at interpreter exit."""
         self._settings = self.DEFAULT_SETTINGS.copy()
-        self._save_settings()
+        self._mark_dirty()
 
     # === ComfyUI Path Detection ===
 
+    def invalidate_paths(self) -> None:
+        """Forget cached environment and path detection results and config.json."""
+        self._env_cache.clear()
+        self._config = None
+
     def detect_comfyui_path(self) -> str | None:
-        """Auto-detect ComfyUI installation path."""
-        common_paths = [
-            # Local common paths
-            Path.home() / "ComfyUI",
-            Path("/workspace/ComfyUI"),  # RunPod
-            Path("/content/ComfyUI"),  # Colab
-            Path("C:/ComfyUI"),  # Windows
-            Path("D:/ComfyUI"),
-            # Relative
-            Path("../ComfyUI"),
-            Path("../../ComfyUI"),
-        ]
-
-        for path in common_paths:
+        """Auto-detect ComfyUI installation path (cached)."""
+        if "detected" not in self._env_cache:
+            self._env_cache["detected"] = self._detect_comfyui_path()
+        return self._env_cache["detected"]
+
+    def _detect_comfyui_path(self) -> str | None:
+        for path in _COMMON_COMFYUI_PATHS:
             if path.exists() and (path / "main.py").exists():
                 return str(path.absolute())
 
         return None
 
     def get_comfyui_path(self) -> str | None:
-        """Get ComfyUI path from config.json (same as addons)."""
-        paths_config = self._config.get("paths", {})
+        """Get ComfyUI path from config.json (same as addons), cached."""
+        if "comfyui" not in self._env_cache:
+            self._env_cache["comfyui"] = self._resolve_comfyui_path()
+        return self._env_cache["comfyui"]
+
+    def _resolve_comfyui_path(self) -> str | None:
+        paths_config = self._get_config().get("paths", {})
         env = self.get_environment()
 
         # Try config.json paths first
@@ -133,23 +183,30 @@ class ConfigManager:
 
     def get_models_path(self) -> str | None:
         """Get ComfyUI models directory path."""
-        comfy_path = self.get_comfyui_path()
-        if comfy_path:
-            models_path = Path(comfy_path) / "models"
-            if models_path.exists():
-                return str(models_path)
-        return None
+        if "models" not in self._env_cache:
+            models = None
+            comfy_path = self.get_comfyui_path()
+            if comfy_path:
+                models_path = Path(comfy_path) / "models"
+                if models_path.exists():
+                    models = str(models_path)
+            self._env_cache["models"] = models
+        return self._env_cache["models"]
 
     def is_runpod(self) -> bool:
         """Check if running on RunPod."""
-        # Check for RunPod environment variable or /workspace without /content (Colab)
-        return bool(os.environ.get("RUNPOD_POD_ID")) or (
-            os.path.exists("/workspace") and not os.path.exists("/content")
-        )
+        if "runpod" not in self._env_cache:
+            # Check for RunPod environment variable or /workspace without /content (Colab)
+            self._env_cache["runpod"] = bool(os.environ.get("RUNPOD_POD_ID")) or (
+                os.path.exists("/workspace") and not os.path.exists("/content")
+            )
+        return self._env_cache["runpod"]
 
     def is_colab(self) -> bool:
         """Check if running on Google Colab."""
-        return os.path.exists("/content") and "COLAB_GPU" in os.environ
+        if "colab" not in self._env_cache:
+            self._env_cache["colab"] = os.path.exists("/content") and "COLAB_GPU" in os.environ
+        return self._env_cache["colab"]
 
     def get_environment(self) -> str:
         """Get current environment type."""
@@ -158,3 +215,14 @@ class ConfigManager:
         if self.is_colab():
             return "colab"
         return "local"
+
+
+_INSTANCE: ConfigManager | None = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Return the shared ConfigManager, loading settings on first use."""
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = ConfigManager()
+    return _INSTANCE
@@ -0,0 +1,73 @@
+"""JSON utilities with optional orjson acceleration."""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str.
+
+    Uses orjson when installed, stdlib json otherwise. Both raise a
+    json.JSONDecodeError subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Files up to this size are parsed straight from a read-only mmap (orjson only)
+MMAP_MAX_SIZE = 5 * 1024 * 1024
+
+
+def load_file(path: Path) -> Any:
+    """Read and parse a JSON file in one go.
+
+    With orjson, small non-empty files are parsed from an mmap, which skips
+    copying the file into an intermediate bytes object.
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if 0 < size <= MMAP_MAX_SIZE:
+                with (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                    memoryview(mm) as view,
+                ):
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+    return loads(path.read_bytes())
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes.
+
+    With indent=True the output uses 2-space indentation and non-ASCII
+    characters unescaped, matching json.dump(indent=2, ensure_ascii=False).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dump_file(path: Path, obj: Any, indent: bool = True) -> None:
+    """Write JSON atomically: serialize, write a temp file, then rename over path.
+
+    Readers never see a half-written file, even if the process dies mid-write.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(dumps(obj, indent=indent))
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
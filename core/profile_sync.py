@@ -1,13 +1,36 @@
 """Profile Sync Service - Load workflow profiles from remote sources."""
 
-import json
+import http.client
+import os
+import threading
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
+from urllib.parse import SplitResult, urljoin, urlsplit
 
+from core.json_utils import dump_file, load_file, loads
+from core.ssl_utils import get_ssl_context
 
-@dataclass
+_HEADERS = {
+    "User-Agent": "CindergaceToolkit/1.0",
+    "Accept": "application/json",
+}
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+# Returned by _fetch_json_etag when the server answers 304 Not Modified
+_NOT_MODIFIED = object()
+
+
+def _uses_proxy(parts: SplitResult) -> bool:
+    """Check whether urllib would route this URL through HTTP(S)_PROXY."""
+    if not urllib.request.getproxies().get(parts.scheme):
+        return False
+    return not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+@dataclass(slots=True, frozen=True)
 class RemoteProfile:
     """A remote profile reference."""
 
@@ -31,41 +54,146 @@ class ProfileSyncService:
     - profiles/svi_wan22.json -> Individual profile
     """
 
-    CACHE_DIR = Path(__file__).parent.parent / "profiles" / ".cache"
+    PROFILES_DIR = Path(__file__).parent.parent / "profiles"
+    CACHE_DIR = PROFILES_DIR / ".cache"
+    FETCH_WORKERS = 8
 
     def __init__(self, base_url: str = ""):
         self.base_url = base_url.rstrip("/")
         self._index: list[RemoteProfile] = []
         self._cached_profiles: dict[str, dict[str, Any]] = {}
+        # mtime_ns of the disk cache file each in-memory profile matches
+        self._cache_mtimes: dict[str, int] = {}
+        self._cache_lock = threading.Lock()  # guards both dicts during parallel fetches
 
         # SSL context for HTTPS (secure by default, configurable)
-        from core.ssl_utils import get_ssl_context
-
         self._ssl_ctx = get_ssl_context()
 
+        # Idle keep-alive connections per (scheme, host, port), reused across fetches
+        self._idle_connections: dict[
+            tuple[str, str, int | None], list[http.client.HTTPConnection]
+        ] = {}
+        self._pool_lock = threading.Lock()
+        # ETag of the index behind self._index, sent as If-None-Match on re-fetch
+        self._index_etag: str | None = None
+
     def set_base_url(self, url: str) -> None:
         """Set the base URL for remote profiles."""
         self.base_url = url.rstrip("/")
         self._index = []  # Clear cached index
+        self._index_etag = None
+        self.close()
+
+    def close(self) -> None:
+        """Close all idle keep-alive connections."""
+        with self._pool_lock:
+            pools, self._idle_connections = self._idle_connections, {}
+        for conns in pools.values():
+            for conn in conns:
+                conn.close()
+
+    def _acquire_connection(
+        self, key: tuple[str, str, int | None], timeout: int
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Get an idle connection for (scheme, host, port), or a new one.
+
+        Returns:
+            (connection, reused)
+        """
+        with self._pool_lock:
+            idle = self._idle_connections.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        scheme, host, port = key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_ctx)
+            return conn, False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _release_connection(
+        self, key: tuple[str, str, int | None], conn: http.client.HTTPConnection
+    ) -> None:
+        """Return a connection to the idle pool for reuse."""
+        with self._pool_lock:
+            self._idle_connections.setdefault(key, []).append(conn)
+
+    def _get(
+        self, parts: SplitResult, timeout: int, headers: dict[str, str]
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        """GET a URL over a pooled connection. Returns (response, body)."""
+        # hostname/port drop any user:pass@ and the brackets around IPv6 literals
+        key = (parts.scheme, parts.hostname or "", parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        while True:
+            conn, reused = self._acquire_connection(key, timeout)
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if reused:
+                    # Server dropped the idle keep-alive connection; retry on a fresh one
+                    continue
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._release_connection(key, conn)
+            return response, body
+
+    def _urlopen_json(self, url: str, timeout: int) -> Any:
+        """Fetch JSON through urllib (proxies, non-HTTP schemes)."""
+        req = urllib.request.Request(url, headers=_HEADERS)
+        with urllib.request.urlopen(req, context=self._ssl_ctx, timeout=timeout) as response:
+            return loads(response.read())
 
     def _fetch_json(self, url: str, timeout: int = 30) -> dict[str, Any] | None:
-        """Fetch JSON from URL."""
+        """Fetch JSON from URL, reusing keep-alive connections per host.
+
+        URLs that urllib would send through a proxy are fetched with urllib.
+        """
+        return self._fetch_json_etag(url, timeout)[0]
+
+    def _fetch_json_etag(
+        self, url: str, timeout: int = 30, etag: str | None = None
+    ) -> tuple[Any, str | None]:
+        """Fetch JSON like _fetch_json, as a conditional GET if etag is given.
+
+        Returns:
+            (data, ETag of the response). data is _NOT_MODIFIED if the server
+            answered 304, and None on errors.
+        """
+        headers = _HEADERS if etag is None else {**_HEADERS, "If-None-Match": etag}
         try:
-            req = urllib.request.Request(
-                url,
-                headers={
-                    "User-Agent": "CindergaceToolkit/1.0",
-                    "Accept": "application/json",
-                },
-            )
-
-            with urllib.request.urlopen(req, context=self._ssl_ctx, timeout=timeout) as response:
-                content = response.read().decode("utf-8")
-                return json.loads(content)
+            for _ in range(_MAX_REDIRECTS + 1):
+                parts = urlsplit(url)
+                if parts.scheme not in ("http", "https") or _uses_proxy(parts):
+                    return self._urlopen_json(url, timeout), None
+
+                response, body = self._get(parts, timeout, headers)
+                status = response.status
+                location = response.getheader("Location")
+                if status == 304 and etag is not None:
+                    return _NOT_MODIFIED, etag
+                if status in _REDIRECT_CODES and location:
+                    url = urljoin(url, location)
+                    continue
+                if status >= 400:
+                    raise OSError(f"HTTP Error {status}")
+                return loads(body), response.getheader("ETag")
+            raise OSError("Too many redirects")
 
         except Exception as e:
             print(f"[ProfileSync] Error fetching {url}: {e}")
-            return None
+            return None, None
 
     def fetch_index(self) -> list[RemoteProfile]:
         """Fetch the profile index from remote server."""
@@ -74,11 +202,14 @@ class ProfileSyncService:
             return []
 
         index_url = f"{self.base_url}/index.json"
-        data = self._fetch_json(index_url)
+        data, etag = self._fetch_json_etag(index_url, etag=self._index_etag)
 
+        if data is _NOT_MODIFIED:
+            return self._index
         if not data:
             return []
 
+        self._index_etag = etag
         self._index = []
         for item in data.get("profiles", []):
             self._index.append(
@@ -125,51 +256,104 @@ class ProfileSyncService:
 
         data = self._fetch_json(url)
         if data:
-            self._cached_profiles[profile_id] = data
+            with self._cache_lock:
+                self._cached_profiles[profile_id] = data
             self._save_to_cache(profile_id, data)
 
         return data
 
+    def fetch_all_profiles(
+        self, ids: list[str] | None = None, max_workers: int | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch several profiles from the index in parallel.
+
+        Args:
+            ids: Profile IDs to fetch (default: every profile in the index)
+            max_workers: Thread count (default: FETCH_WORKERS)
+
+        Returns:
+            Mapping of profile ID to profile data for profiles that loaded
+        """
+        wanted = None if ids is None else set(ids)
+        profile_ids = list(
+            dict.fromkeys(p.id for p in self._index if wanted is None or p.id in wanted)
+        )
+        if not profile_ids:
+            return {}
+
+        workers = min(max_workers or self.FETCH_WORKERS, len(profile_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="profile-fetch") as pool:
+            results = zip(profile_ids, pool.map(self.fetch_profile, profile_ids), strict=True)
+            return {profile_id: data for profile_id, data in results if data}
+
     def _save_to_cache(self, profile_id: str, data: dict[str, Any]) -> None:
         """Save profile to local cache."""
         self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
         cache_file = self.CACHE_DIR / f"{profile_id}.json"
 
         try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            dump_file(cache_file, data)
+            mtime_ns = cache_file.stat().st_mtime_ns
         except Exception as e:
             print(f"[ProfileSync] Error caching profile: {e}")
+            return
+
+        with self._cache_lock:
+            self._cache_mtimes[profile_id] = mtime_ns
 
     def load_from_cache(self, profile_id: str) -> dict[str, Any] | None:
-        """Load profile from local cache."""
+        """Load profile from local cache.
+
+        The parsed profile is kept in memory and only re-read from disk
+        when the cache file's mtime changes.
+        """
         cache_file = self.CACHE_DIR / f"{profile_id}.json"
 
-        if not cache_file.exists():
+        try:
+            mtime_ns = cache_file.stat().st_mtime_ns
+        except OSError:
             return None
 
+        with self._cache_lock:
+            if self._cache_mtimes.get(profile_id) == mtime_ns:
+                cached = self._cached_profiles.get(profile_id)
+                if cached is not None:
+                    return cached
+
         try:
-            with open(cache_file, encoding="utf-8") as f:
-                return json.load(f)
+            data = load_file(cache_file)
         except Exception as e:
             print(f"[ProfileSync] Error loading cached profile: {e}")
             return None
 
+        with self._cache_lock:
+            self._cached_profiles[profile_id] = data
+            self._cache_mtimes[profile_id] = mtime_ns
+        return data
+
     def clear_cache(self) -> None:
         """Clear all cached profiles."""
-        if self.CACHE_DIR.exists():
-            for f in self.CACHE_DIR.glob("*.json"):
-                f.unlink()
-        self._cached_profiles = {}
+        try:
+            with os.scandir(self.CACHE_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                        os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+        with self._cache_lock:
+            self._cached_profiles = {}
+            self._cache_mtimes = {}
 
     def get_local_profiles(self) -> list[str]:
         """Get list of locally saved/cached profiles."""
-        profiles_dir = Path(__file__).parent.parent / "profiles"
-        profiles = []
-
-        if profiles_dir.exists():
-            for f in profiles_dir.glob("*.json"):
-                if f.name != "index.json":
-                    profiles.append(f.stem)
-
-        return profiles
+        try:
+            with os.scandir(self.PROFILES_DIR) as entries:
+                return [
+                    entry.name[:-5]
+                    for entry in entries
+                    if entry.name.endswith(".json")
+                    and entry.name != "index.json"
+                    and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return []
@@ -2,8 +2,11 @@
 
 import json
 import ssl
+from functools import lru_cache
 from pathlib import Path
 
+from core.config_loader import load_config_file
+
 
 def get_ssl_context(config_dir: Path | None = None) -> ssl.SSLContext:
     """Get SSL context based on configuration.
@@ -16,6 +19,9 @@ def get_ssl_context(config_dir: Path | None = None) -> ssl.SSLContext:
         }
     }
 
+    The context is cached until one of the config files changes; callers
+    share it and must not modify it.
+
     Args:
         config_dir: Optional path to config directory. If None, uses project root.
 
@@ -25,19 +31,34 @@ def get_ssl_context(config_dir: Path | None = None) -> ssl.SSLContext:
     if config_dir is None:
         config_dir = Path(__file__).parent.parent
 
+    config_paths = (
+        config_dir / ".config" / "config.json",
+        config_dir / "config" / "config.json",
+    )
+    return _cached_ssl_context(config_paths, tuple(_mtime_ns(p) for p in config_paths))
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _cached_ssl_context(
+    config_paths: tuple[Path, ...], mtimes: tuple[int | None, ...]
+) -> ssl.SSLContext:
+    """Build the SSL context; mtimes only key the cache."""
     # Check for disable_ssl_verify in config
     disable_ssl = False
 
-    for config_path in [
-        config_dir / ".config" / "config.json",
-        config_dir / "config" / "config.json",
-    ]:
+    for config_path in config_paths:
         if config_path.exists():
             try:
-                with open(config_path, encoding="utf-8") as f:
-                    config = json.load(f)
-                    disable_ssl = config.get("security", {}).get("disable_ssl_verify", False)
-                    break
+                config = load_config_file(config_path)
+                disable_ssl = config.get("security", {}).get("disable_ssl_verify", False)
+                break
             except (json.JSONDecodeError, OSError):
                 pass
 
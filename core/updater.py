@@ -1,12 +1,20 @@
 """Git-based Auto-Updater for Cindergrace Toolkit."""
 
-import json
 import subprocess
+import time
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 
+from core.config_loader import load_config_file
 
-@dataclass
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - optional dependency
+    pygit2 = None
+
+
+@dataclass(slots=True, frozen=True)
 class UpdateInfo:
     """Information about available update."""
 
@@ -25,18 +33,24 @@ class GitUpdater:
     2. Fetch remote changes
     3. Compare local vs remote
     4. Pull if update available
+
+    Read-only queries (commit, branch, local vs remote) run in-process via
+    pygit2 when it is installed; fetch/pull/stash always use the git CLI.
     """
 
+    # Skip `git fetch` if the last fetch is newer than this (config: update.fetch_ttl)
+    FETCH_TTL = 300
+
     def __init__(self, repo_path: Path | None = None):
         self.repo_path = repo_path or Path(__file__).parent.parent
         self._config = self._load_config()
+        self._repo = None  # pygit2.Repository, opened on first use
 
     def _load_config(self) -> dict:
         """Load update config from config.json."""
         config_file = self.repo_path / "config" / "config.json"
         if config_file.exists():
-            with open(config_file, encoding="utf-8") as f:
-                return json.load(f).get("update", {})
+            return load_config_file(config_file).get("update", {})
         return {}
 
     def _run_git(self, *args, capture: bool = True) -> tuple[bool, str]:
@@ -57,6 +71,17 @@ class GitUpdater:
         except Exception as e:
             return False, str(e)
 
+    def _repository(self):
+        """Open the repository with pygit2, or None to fall back to the git CLI."""
+        if pygit2 is None:
+            return None
+        if self._repo is None:
+            try:
+                self._repo = pygit2.Repository(str(self.repo_path))
+            except (KeyError, pygit2.GitError):
+                return None
+        return self._repo
+
     def is_git_repo(self) -> bool:
         """Check if we're in a git repository."""
         git_dir = self.repo_path / ".git"
@@ -64,16 +89,46 @@ class GitUpdater:
 
     def get_current_commit(self) -> str | None:
         """Get current commit hash."""
+        repo = self._repository()
+        if repo is not None:
+            try:
+                return str(repo.head.target)[:8]
+            except pygit2.GitError:
+                return None
+
         success, output = self._run_git("rev-parse", "HEAD")
         return output[:8] if success else None
 
     def get_current_branch(self) -> str | None:
         """Get current branch name."""
+        repo = self._repository()
+        if repo is not None:
+            try:
+                return "HEAD" if repo.head_is_detached else repo.head.shorthand
+            except pygit2.GitError:
+                return None
+
         success, output = self._run_git("rev-parse", "--abbrev-ref", "HEAD")
         return output if success else None
 
-    def fetch_remote(self) -> bool:
-        """Fetch changes from remote."""
+    def _fetch_is_fresh(self) -> bool:
+        """Check whether .git/FETCH_HEAD was written within the fetch TTL."""
+        ttl = self._config.get("fetch_ttl", self.FETCH_TTL)
+        try:
+            age = time.time() - (self.repo_path / ".git" / "FETCH_HEAD").stat().st_mtime
+        except OSError:
+            return False
+        return 0 <= age < ttl
+
+    def fetch_remote(self, force: bool = False) -> bool:
+        """Fetch changes from remote.
+
+        Args:
+            force: Fetch even if the last fetch is more recent than the TTL
+        """
+        if not force and self._fetch_is_fresh():
+            return True
+
         branch = self._config.get("branch", "main")
         success, _ = self._run_git("fetch", "origin", branch)
         return success
@@ -96,6 +151,43 @@ class GitUpdater:
         if not current:
             return None
 
+        compared = self._compare_with_remote(branch)
+        if compared is None:
+            return None
+        remote, commits_behind, change_summary = compared
+
+        return UpdateInfo(
+            current_commit=current,
+            remote_commit=remote,
+            has_update=commits_behind > 0,
+            commits_behind=commits_behind,
+            change_summary=change_summary,
+        )
+
+    def _compare_with_remote(self, branch: str) -> tuple[str, int, str] | None:
+        """Compare HEAD with origin/<branch>.
+
+        Returns:
+            (remote commit, commits behind, change summary) or None on error
+        """
+        repo = self._repository()
+        if repo is not None:
+            try:
+                head = repo.head.target
+                remote = repo.revparse_single(f"origin/{branch}").id
+                _, commits_behind = repo.ahead_behind(head, remote)
+                change_summary = ""
+                if commits_behind > 0:
+                    walker = repo.walk(remote, pygit2.GIT_SORT_TOPOLOGICAL)
+                    walker.hide(head)
+                    change_summary = "\n".join(
+                        f"{str(commit.id)[:7]} {(commit.message.splitlines() or [''])[0]}"
+                        for commit in islice(walker, 10)
+                    )
+                return str(remote)[:8], commits_behind, change_summary
+            except (KeyError, pygit2.GitError):
+                return None
+
         # Get remote commit
         success, remote = self._run_git("rev-parse", f"origin/{branch}")
         if not success:
@@ -113,13 +205,7 @@ class GitUpdater:
             if success:
                 change_summary = log
 
-        return UpdateInfo(
-            current_commit=current,
-            remote_commit=remote,
-            has_update=commits_behind > 0,
-            commits_behind=commits_behind,
-            change_summary=change_summary,
-        )
+        return remote, commits_behind, change_summary
 
     def pull_updates(self) -> tuple[bool, str]:
         """Pull latest changes from remote."""
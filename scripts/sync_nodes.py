@@ -30,6 +30,14 @@ LOGS_DIR = PROJECT_DIR / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
 ERROR_LOG = LOGS_DIR / "sync_errors.log"
 
+# Fallback ComfyUI locations; a path from config.json is tried first
+COMFYUI_CANDIDATES = (
+    Path("/workspace/ComfyUI"),  # RunPod
+    Path("/content/ComfyUI"),  # Colab
+    Path.home() / "ComfyUI",  # Local
+    Path.home() / "projekte" / "ComfyUI",  # Local alt
+)
+
 
 def log_error(node_name: str, operation: str, error_msg: str) -> None:
     """Log error to sync_errors.log with timestamp."""
@@ -64,38 +72,32 @@ def load_custom_nodes_config() -> dict:
 
 
 def detect_comfyui_path() -> Path | None:
-    """Auto-detect ComfyUI path based on environment."""
-    candidates = [
-        Path("/workspace/ComfyUI"),  # RunPod
-        Path("/content/ComfyUI"),  # Colab
-        Path.home() / "ComfyUI",  # Local
-        Path.home() / "projekte" / "ComfyUI",  # Local alt
-    ]
-
-    for config_path in [PROJECT_DIR / ".config" / "config.json", CONFIG_DIR / "config.json"]:
+    """Auto-detect ComfyUI path based on environment.
+
+    Paths from .config/config.json, then config/config.json, are tried
+    before the built-in candidates.
+    """
+    if os.path.exists("/workspace"):
+        env = "runpod"
+    elif os.path.exists("/content"):
+        env = "colab"
+    else:
+        env = "local"
+
+    configured = []
+    for config_path in (PROJECT_DIR / ".config" / "config.json", CONFIG_DIR / "config.json"):
         if config_path.exists():
             try:
                 with open(config_path, encoding="utf-8") as f:
                     config = json.load(f)
 
-                paths = config.get("paths", {}).get("comfyui", {})
-
-                if os.path.exists("/workspace"):
-                    env = "runpod"
-                elif os.path.exists("/content"):
-                    env = "colab"
-                else:
-                    env = "local"
-
-                comfy_path = paths.get(env, "")
+                comfy_path = config.get("paths", {}).get("comfyui", {}).get(env, "")
                 if comfy_path:
-                    if comfy_path.startswith("~"):
-                        comfy_path = os.path.expanduser(comfy_path)
-                    candidates.insert(0, Path(comfy_path))
+                    configured.append(Path(os.path.expanduser(comfy_path)))
             except (json.JSONDecodeError, KeyError):
                 pass
 
-    for candidate in candidates:
+    for candidate in (*configured, *COMFYUI_CANDIDATES):
         if candidate.exists() and (candidate / "main.py").exists():
             return candidate
 
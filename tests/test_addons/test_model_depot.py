@@ -0,0 +1,378 @@
+"""Tests for addons/model_depot - Model download and backup handling."""
+
+import io
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def mock_gradio():
+    """Model Depot imports gradio at module level."""
+    sys.modules["gradio"] = MagicMock()
+
+
+class TestMaybeCopy:
+    """Tests for _maybe_copy - Skip redundant backup copies."""
+
+    def test_copies_when_destination_missing(self, temp_dir):
+        """Should copy when destination does not exist."""
+        from addons.model_depot.addon import _maybe_copy
+
+        src = temp_dir / "src.safetensors"
+        dst = temp_dir / "dst.safetensors"
+        src.write_bytes(b"model data")
+
+        assert _maybe_copy(src, dst) is True
+        assert dst.read_bytes() == b"model data"
+
+    def test_skips_identical_destination(self, temp_dir):
+        """Should not rewrite a destination with identical content."""
+        from addons.model_depot.addon import _maybe_copy
+
+        src = temp_dir / "src.safetensors"
+        dst = temp_dir / "dst.safetensors"
+        src.write_bytes(b"model data")
+        dst.write_bytes(b"model data")
+
+        assert _maybe_copy(src, dst) is False
+
+    def test_copies_when_content_differs(self, temp_dir):
+        """Same size but different content should still be copied."""
+        from addons.model_depot.addon import _maybe_copy
+
+        src = temp_dir / "src.safetensors"
+        dst = temp_dir / "dst.safetensors"
+        src.write_bytes(b"model data")
+        dst.write_bytes(b"other data")
+
+        assert _maybe_copy(src, dst) is True
+        assert dst.read_bytes() == b"model data"
+
+
+class TestFindOtherModels:
+    """Tests for find_other_models - Scan for models outside the workflow."""
+
+    @pytest.fixture
+    def model_depot(self, mock_model_files):
+        """ModelDepotAddon pointing at the mock ComfyUI models directory."""
+        from addons.model_depot.addon import ModelDepotAddon
+
+        addon = ModelDepotAddon()
+        addon._models_path = mock_model_files
+        addon._workflow_models = {
+            "target_folders": ["vae", "checkpoints", "loras"],
+            "workflows": {"wf": {"model_sets": {"8GB": {"vram_gb": 8, "models": ["vae_model"]}}}},
+            "models": {
+                "vae_model": {"filename": "test_vae.safetensors", "target_path": "vae"},
+            },
+        }
+        return addon
+
+    def test_excludes_workflow_models(self, model_depot):
+        """Models belonging to the workflow/tier should not be listed."""
+        result = model_depot.find_other_models("wf", "S")
+
+        assert ("test_checkpoint.safetensors", "checkpoints", 2) in result
+        assert all(name != "test_vae.safetensors" for name, _, _ in result)
+
+    def test_matches_extensions_case_insensitive(self, model_depot, mock_model_files):
+        """Upper-case extensions count as models, other files are ignored."""
+        (mock_model_files / "loras" / "STYLE.SAFETENSORS").write_bytes(b"x")
+        (mock_model_files / "loras" / "readme.txt").write_bytes(b"x")
+        (mock_model_files / "loras" / "sub.ckpt").mkdir()
+
+        names = [name for name, _, _ in model_depot.find_other_models("wf", "S")]
+
+        assert "STYLE.SAFETENSORS" in names
+        assert "readme.txt" not in names
+        assert "sub.ckpt" not in names
+
+
+class TestVramTiers:
+    """Tests for VRAM tier lookup."""
+
+    @pytest.fixture
+    def model_depot(self):
+        """ModelDepotAddon with a workflow spanning several VRAM sets."""
+        from addons.model_depot.addon import ModelDepotAddon
+
+        addon = ModelDepotAddon()
+        addon._workflow_models = {
+            "workflows": {
+                "wf": {
+                    "model_sets": {
+                        "12GB": {"vram_gb": 12, "models": ["small"]},
+                        "24GB": {"vram_gb": 24, "models": ["large"]},
+                        "32GB": {"vram_gb": 32, "models": ["large", "extra"]},
+                        "48GB": {"vram_gb": 48, "models": ["huge"]},
+                    }
+                }
+            },
+            "models": {},
+        }
+        return addon
+
+    def test_vram_to_tier_covers_all_tiers(self):
+        """Every VRAM value maps back to its tier."""
+        from addons.model_depot.addon import ModelDepotAddon
+
+        for tier, vrams in ModelDepotAddon.VRAM_TIERS.items():
+            for vram in vrams:
+                assert ModelDepotAddon._VRAM_TO_TIER[vram] == tier
+
+    def test_tiers_for_workflow(self, model_depot):
+        """Unknown VRAM values are ignored."""
+        assert model_depot.get_vram_tiers_for_workflow("wf") == ["L", "S"]
+
+    def test_models_for_tier(self, model_depot):
+        """Models from all sets of the tier are merged."""
+        ids = [m.id for m in model_depot.get_models_for_workflow_tier("wf", "L")]
+        assert ids == ["extra", "large"]
+
+
+class TestReloadIfChanged:
+    """Tests for _reload_if_changed - mtime-based workflow_models.json reload."""
+
+    @pytest.fixture
+    def model_depot(self, temp_config_dir, monkeypatch):
+        """ModelDepotAddon reading data/ from a temp directory."""
+        from addons.model_depot.addon import ModelDepotAddon
+
+        data_dir = temp_config_dir["root"] / "data"
+        data_dir.mkdir()
+        monkeypatch.setattr(ModelDepotAddon, "DATA_DIR", data_dir)
+
+        (data_dir / "workflow_models.json").write_text('{"workflows": {"a": {}}}')
+        addon = ModelDepotAddon()
+        addon._load_workflow_models()
+        return addon
+
+    def test_unchanged_file_not_reparsed(self, model_depot, monkeypatch):
+        """Should not parse the file again when mtime is unchanged."""
+        calls = []
+        monkeypatch.setattr(model_depot, "_load_workflow_models", lambda: calls.append(1))
+
+        model_depot._reload_if_changed()
+
+        assert calls == []
+
+    def test_changed_file_reloaded(self, model_depot):
+        """Should pick up a newer file."""
+        import os
+
+        wf_file = model_depot.DATA_DIR / "workflow_models.json"
+        wf_file.write_text('{"workflows": {"b": {}}}')
+        os.utime(wf_file, ns=(0, model_depot._wf_mtime_ns + 1_000_000))
+
+        model_depot._reload_if_changed()
+
+        assert list(model_depot._workflow_models["workflows"]) == ["b"]
+
+
+class TestRefreshModelsTable:
+    """Tests for refresh_models_table - Coalesced UI table refresh."""
+
+    @pytest.fixture
+    def model_depot(self, monkeypatch):
+        """ModelDepotAddon with a stubbed table builder."""
+        from addons.model_depot.addon import ModelDepotAddon
+
+        addon = ModelDepotAddon()
+        monkeypatch.setattr(addon, "get_models_table", lambda wf, tier: [["✅", "a", "vae", 1]])
+        return addon
+
+    def test_returns_changed_table(self, model_depot):
+        """Should return the table and its hash when content changed."""
+        table, table_hash, rebuilt = model_depot.refresh_models_table("wf", "S", None)
+
+        assert table == [["✅", "a", "vae", 1]]
+        assert table_hash is not None
+        assert rebuilt is True
+
+    def test_unchanged_table_skipped(self, model_depot):
+        """Should return None when the client already has this table."""
+        _, table_hash, _ = model_depot.refresh_models_table("wf", "S", None)
+
+        assert model_depot.refresh_models_table("wf", "S", table_hash) == (
+            None,
+            table_hash,
+            True,
+        )
+
+    def test_concurrent_refresh_serves_last_table(self, model_depot):
+        """While another refresh holds the lock, the last table is returned."""
+        with model_depot._refresh_lock:
+            assert model_depot.refresh_models_table("wf", "S", 42) == (None, 42, False)
+
+        table, table_hash, _ = model_depot.refresh_models_table("wf", "S", None)
+
+        with model_depot._refresh_lock:
+            assert model_depot.refresh_models_table("wf", "S", 42) == (
+                table,
+                table_hash,
+                False,
+            )
+            assert model_depot.refresh_models_table("wf", "S", table_hash) == (
+                None,
+                table_hash,
+                False,
+            )
+            # A different view never gets another view's table
+            assert model_depot.refresh_models_table("wf", "M", 42) == (None, 42, False)
+
+
+class _FakeResponse(io.BytesIO):
+    """urlopen() response serving a fixed body."""
+
+    def __init__(self, body: bytes):
+        super().__init__(body)
+        self.headers = {"Content-Length": str(len(body))}
+
+
+class _InlineThread:
+    """threading.Thread stand-in that runs the target on start()."""
+
+    def __init__(self, target, daemon=None):
+        self._target = target
+
+    def start(self):
+        self._target()
+
+
+class TestDownloadBackup:
+    """Tests for download_model - Backup written in lockstep with the download."""
+
+    # Several read chunks (chunk size is 1 MB)
+    BODY = bytes(range(256)) * 10_000
+
+    @pytest.fixture
+    def model_depot(self, temp_dir, monkeypatch):
+        """ModelDepotAddon downloading BODY synchronously into temp dirs."""
+        from addons.model_depot import addon as model_depot_module
+
+        monkeypatch.setattr(model_depot_module.threading, "Thread", _InlineThread)
+
+        addon = model_depot_module.ModelDepotAddon()
+        addon._models_path = temp_dir / "models"
+        addon._backup_path = temp_dir / "backup"
+        addon._workflow_models = {
+            "models": {
+                "m": {
+                    "filename": "m.safetensors",
+                    "url": "https://example.com/m.safetensors",
+                    "target_path": "vae",
+                }
+            }
+        }
+        addon._opener = MagicMock()
+        addon._opener.open.side_effect = lambda req, timeout: _FakeResponse(self.BODY)
+        return addon
+
+    def test_backup_written_during_download(self, model_depot, monkeypatch):
+        """The backup is filled from the same reads, without a second copy pass."""
+        from addons.model_depot import addon as model_depot_module
+
+        copies = []
+        monkeypatch.setattr(model_depot_module, "_maybe_copy", lambda *a: copies.append(a))
+        monkeypatch.setattr(model_depot_module.shutil, "copyfile", lambda *a: copies.append(a))
+
+        model_depot.download_model("m")
+
+        target = model_depot._models_path / "vae" / "m.safetensors"
+        backup = model_depot._backup_path / "vae" / "m.safetensors"
+        assert model_depot._download_status["m.safetensors"] == "Done"
+        assert target.read_bytes() == self.BODY
+        assert backup.read_bytes() == self.BODY
+        assert backup.stat().st_mtime_ns == target.stat().st_mtime_ns
+        assert copies == []
+        model_depot._opener.open.assert_called_once()
+
+    def test_failed_backup_write_keeps_download(self, model_depot, monkeypatch):
+        """A backup write error removes the partial backup but not the download."""
+        from addons.model_depot import addon as model_depot_module
+
+        backup = model_depot._backup_path / "vae" / "m.safetensors"
+
+        class FailingWrites(io.FileIO):
+            def write(self, data):
+                if self.tell() > 0:
+                    raise OSError(28, "No space left on device")
+                return super().write(data)
+
+        def fake_open(path, mode="r", *args, **kwargs):
+            if Path(path) == backup:
+                return FailingWrites(path, mode)
+            return open(path, mode, *args, **kwargs)
+
+        monkeypatch.setattr(model_depot_module, "open", fake_open, raising=False)
+
+        model_depot.download_model("m")
+
+        target = model_depot._models_path / "vae" / "m.safetensors"
+        assert model_depot._download_status["m.safetensors"] == "Done"
+        assert target.read_bytes() == self.BODY
+        assert not backup.exists()
+
+
+class TestDownloadConnection:
+    """Tests for the download opener and its enlarged receive buffer."""
+
+    def test_opener_uses_download_handler(self):
+        """HTTPS downloads go through _DownloadHTTPSConnection."""
+        from addons.model_depot.addon import (
+            ModelDepotAddon,
+            _create_download_socket,
+            _DownloadHTTPSConnection,
+            _DownloadHTTPSHandler,
+        )
+
+        opener = ModelDepotAddon()._get_opener()
+        handlers = opener.handle_open["https"]
+        assert [type(h) for h in handlers] == [_DownloadHTTPSHandler]
+
+        handler = handlers[0]
+        handler.do_open = MagicMock()
+        handler.https_open(MagicMock())
+        assert handler.do_open.call_args.args[0] is _DownloadHTTPSConnection
+        assert _DownloadHTTPSConnection("example.com")._create_connection is (
+            _create_download_socket
+        )
+
+    def test_rcvbuf_set_before_connect(self, monkeypatch):
+        """SO_RCVBUF must be set before the handshake to affect the TCP window."""
+        import socket
+
+        from addons.model_depot.addon import _DOWNLOAD_RCVBUF, _create_download_socket
+
+        calls = []
+
+        class FakeSocket:
+            def __init__(self, *args):
+                pass
+
+            def setsockopt(self, level, option, value):
+                calls.append(("setsockopt", option, value))
+
+            def settimeout(self, timeout):
+                calls.append(("settimeout", timeout))
+
+            def connect(self, sockaddr):
+                calls.append(("connect", sockaddr))
+
+        monkeypatch.setattr(
+            socket,
+            "getaddrinfo",
+            lambda *a: [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("203.0.113.1", 443))],
+        )
+        monkeypatch.setattr(socket, "socket", FakeSocket)
+
+        _create_download_socket(("example.com", 443), 60)
+
+        assert calls == [
+            ("setsockopt", socket.SO_RCVBUF, _DOWNLOAD_RCVBUF),
+            ("settimeout", 60),
+            ("connect", ("203.0.113.1", 443)),
+        ]
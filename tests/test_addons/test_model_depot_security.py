@@ -137,6 +137,22 @@ class TestSanitizePath:
         result = _sanitize_path(base, "loras", "模型.safetensors")
         assert result is not None
 
+    def test_unusual_characters_still_resolved(self, temp_dir):
+        """Names outside the plain charset should go through resolve()."""
+        from addons.model_depot.addon import _sanitize_path
+
+        base = temp_dir / "models"
+        base.mkdir()
+        (base / "loras").mkdir()
+
+        result = _sanitize_path(base, "loras", "my lora (v2).safetensors")
+        assert result is not None
+        assert result.is_relative_to(base.resolve())
+
+        result = _sanitize_path(base, "loras", "model.safetensors\n")
+        assert result is not None
+        assert result.name == "model.safetensors\n"
+
 
 class TestIsAllowedFolder:
     """Tests for _is_allowed_folder method - Allowlist protection."""
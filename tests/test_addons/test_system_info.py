@@ -0,0 +1,327 @@
+"""Tests for addons/system_info - System information panels."""
+
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def mock_gradio():
+    """System Info imports gradio at module level."""
+    sys.modules["gradio"] = MagicMock()
+
+
+MEMINFO = (
+    b"MemTotal:       32768000 kB\n"
+    b"MemFree:         1024000 kB\n"
+    b"MemAvailable:   16384000 kB\n"
+    b"SwapTotal:             0 kB\n"
+)
+
+
+class TestMeminfoParser:
+    """Tests for _meminfo_kb - /proc/meminfo byte scanner."""
+
+    def test_reads_values(self):
+        """Should return values in kB."""
+        from addons.system_info.addon import _meminfo_kb
+
+        assert _meminfo_kb(MEMINFO, b"MemTotal:") == 32768000
+        assert _meminfo_kb(MEMINFO, b"MemAvailable:") == 16384000
+
+    def test_missing_key(self):
+        """Should return None for keys not present."""
+        from addons.system_info.addon import _meminfo_kb
+
+        assert _meminfo_kb(b"MemTotal: 1 kB\n", b"MemAvailable:") is None
+
+    def test_matches_line_start_only(self):
+        """A key must not match as a suffix of another key."""
+        from addons.system_info.addon import _meminfo_kb
+
+        buf = b"HugeMemFree: 5 kB\nMemFree: 7 kB"
+        assert _meminfo_kb(buf, b"MemFree:") == 7
+
+
+class TestPollIntervals:
+    """Tests for _poll_intervals - Env var overrides of panel refresh rates."""
+
+    def test_defaults(self, monkeypatch):
+        """Without env vars the PANEL_INTERVALS defaults apply."""
+        from addons.system_info.addon import PANEL_INTERVALS, POLL_ENV_VARS, _poll_intervals
+
+        for var in POLL_ENV_VARS.values():
+            monkeypatch.delenv(var, raising=False)
+
+        assert _poll_intervals() == PANEL_INTERVALS
+
+    def test_override(self, monkeypatch):
+        """Valid env values override the default."""
+        from addons.system_info.addon import _poll_intervals
+
+        monkeypatch.setenv("CINDERGRACE_GPU_POLL_SEC", "0.5")
+
+        assert _poll_intervals()["gpu"] == 0.5
+
+    def test_invalid_ignored(self, monkeypatch):
+        """Non-numeric or non-positive values keep the default."""
+        from addons.system_info.addon import PANEL_INTERVALS, _poll_intervals
+
+        monkeypatch.setenv("CINDERGRACE_MEM_POLL_SEC", "fast")
+        monkeypatch.setenv("CINDERGRACE_TOOLKIT_POLL_SEC", "0")
+
+        intervals = _poll_intervals()
+        assert intervals["mem"] == PANEL_INTERVALS["mem"]
+        assert intervals["toolkit"] == PANEL_INTERVALS["toolkit"]
+
+
+class TestGpuStreamInterval:
+    """Tests for the nvidia-smi -lms period."""
+
+    def test_follows_gpu_poll_interval(self, monkeypatch):
+        """CINDERGRACE_GPU_POLL_SEC also sets the nvidia-smi sampling period."""
+        from addons.system_info.addon import SystemInfoAddon
+
+        monkeypatch.setenv("CINDERGRACE_GPU_POLL_SEC", "2.5")
+
+        assert SystemInfoAddon()._gpu_stream_ms() == 2500
+
+    def test_clamped_to_minimum(self, monkeypatch):
+        """Very short poll intervals do not make nvidia-smi sample faster than the minimum."""
+        from addons.system_info.addon import GPU_STREAM_MIN_MS, SystemInfoAddon
+
+        monkeypatch.setenv("CINDERGRACE_GPU_POLL_SEC", "0.01")
+
+        assert SystemInfoAddon()._gpu_stream_ms() == GPU_STREAM_MIN_MS
+
+
+class FakeSmiProcess:
+    """Stand-in for a streaming nvidia-smi Popen."""
+
+    instances: list["FakeSmiProcess"] = []
+
+    def __init__(self, args, **kwargs):
+        self.args = args
+        # Two samples: the repeated index marks the first one as complete
+        self.stdout = iter(["0, RTX 4090, 24564, 1000, 23564, 45\n"] * 2)
+        self.returncode = None
+        self.calls = []
+        FakeSmiProcess.instances.append(self)
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.calls.append("terminate")
+
+    def wait(self, timeout=None):
+        self.calls.append(("wait", timeout))
+        self.returncode = -15
+        return self.returncode
+
+    def kill(self):
+        self.calls.append("kill")
+
+
+class StreamingSmiProcess(FakeSmiProcess):
+    """Fake nvidia-smi that prints one sample per period in real time."""
+
+    samples: list[list[str]] = []
+    period = 5.0
+
+    def __init__(self, args, **kwargs):
+        super().__init__(args, **kwargs)
+        self._stopped = threading.Event()
+        self.stdout = self._stream()
+
+    def _stream(self):
+        for i, sample in enumerate(self.samples):
+            if i and self._stopped.wait(self.period):
+                return
+            yield from sample
+        # Keep running (no further output) until terminated
+        self._stopped.wait()
+
+    def terminate(self):
+        super().terminate()
+        self._stopped.set()
+
+
+class TestGpuSources:
+    """Tests for get_gpu_info source selection (NVML vs. nvidia-smi stream)."""
+
+    @pytest.fixture
+    def system_info(self, monkeypatch):
+        """addon module with Popen replaced and persistence mode reported as enabled."""
+        import subprocess
+
+        from addons.system_info import addon as system_info
+
+        FakeSmiProcess.instances = []
+        monkeypatch.setattr(system_info.subprocess, "Popen", FakeSmiProcess)
+        monkeypatch.setattr(
+            system_info,
+            "_run_quick",
+            lambda args, **kw: subprocess.CompletedProcess(args, 0, stdout="Enabled\n"),
+        )
+        monkeypatch.setattr(system_info, "pynvml", None)
+        return system_info
+
+    def test_stream_rows_and_unload(self, system_info):
+        """Without NVML, rows come from one long-lived nvidia-smi process."""
+        addon = system_info.SystemInfoAddon()
+
+        info = addon.get_gpu_info()
+        addon.get_gpu_info()
+
+        assert "**GPU 0:** RTX 4090" in info
+        assert "- VRAM: 1000 MB / 24564 MB (frei: 23564 MB)" in info
+        assert len(FakeSmiProcess.instances) == 1
+        proc = FakeSmiProcess.instances[0]
+        assert proc.args[-2:] == ["-lms", str(addon._gpu_stream_ms())]
+
+        addon.on_unload()
+
+        assert proc.calls == ["terminate", ("wait", system_info.GPU_STREAM_STOP_TIMEOUT)]
+        assert addon._gpu_proc is None
+        assert addon._read_gpu_stream_rows() is None
+        assert len(FakeSmiProcess.instances) == 1
+
+    def test_first_read_wait_ignores_poll_interval(self, system_info, monkeypatch):
+        """A long GPU poll interval must not stretch the wait for the first sample."""
+        monkeypatch.setenv("CINDERGRACE_GPU_POLL_SEC", "600")
+        monkeypatch.setattr(system_info, "GPU_STREAM_START_TIMEOUT", 0.2)
+        monkeypatch.setattr(system_info.subprocess, "Popen", StreamingSmiProcess)
+        monkeypatch.setattr(StreamingSmiProcess, "samples", [])
+        addon = system_info.SystemInfoAddon()
+
+        start = time.monotonic()
+        try:
+            assert addon._read_gpu_stream_rows() == []
+        finally:
+            addon.on_unload()
+
+        assert time.monotonic() - start < 2
+
+    def test_first_sample_does_not_wait_for_second(self, system_info, monkeypatch):
+        """The first read returns once the first sample is in, not after a full period."""
+        sample = [
+            "0, RTX 4090, 24564, 1000, 23564, 45\n",
+            "1, RTX 3090, 24576, 2000, 22576, 50\n",
+        ]
+        monkeypatch.setattr(system_info.subprocess, "Popen", StreamingSmiProcess)
+        monkeypatch.setattr(StreamingSmiProcess, "samples", [sample, sample])
+        addon = system_info.SystemInfoAddon()
+
+        start = time.monotonic()
+        try:
+            info = addon.get_gpu_info()
+        finally:
+            addon.on_unload()
+
+        assert time.monotonic() - start < 1
+        assert "**GPU 0:** RTX 4090" in info
+        assert "**GPU 1:** RTX 3090" in info
+
+    def test_nvml_preferred_over_stream(self, system_info, monkeypatch):
+        """With NVML available, nvidia-smi is never spawned."""
+        nvml = MagicMock()
+        nvml.NVMLError = type("NVMLError", (Exception,), {})
+        nvml.nvmlDeviceGetCount.return_value = 1
+        nvml.nvmlDeviceGetName.return_value = b"A100"
+        nvml.nvmlDeviceGetMemoryInfo.return_value = MagicMock(
+            total=40 << 30, used=2 << 30, free=38 << 30
+        )
+        nvml.nvmlDeviceGetTemperature.return_value = 50
+        nvml.nvmlDeviceGetPersistenceMode.return_value = 1
+        monkeypatch.setattr(system_info, "pynvml", nvml)
+
+        addon = system_info.SystemInfoAddon()
+        addon._init_nvml()
+        info = addon.get_gpu_info()
+
+        assert "**GPU 0:** A100" in info
+        assert "- VRAM: 2048 MB / 40960 MB (frei: 38912 MB)" in info
+        assert FakeSmiProcess.instances == []
+
+        addon.on_unload()
+        nvml.nvmlShutdown.assert_called_once()
+
+
+class TestNoGpuBackoff:
+    """Tests for get_gpu_info on hosts without a usable nvidia-smi."""
+
+    @pytest.fixture
+    def system_info(self, monkeypatch):
+        """SystemInfoAddon whose nvidia-smi stream never starts."""
+        from addons.system_info.addon import SystemInfoAddon
+
+        addon = SystemInfoAddon()
+        calls = []
+        monkeypatch.setattr(addon, "_read_gpu_stream_rows", lambda: calls.append(1))
+        addon.probe_calls = calls
+        return addon
+
+    def test_skips_probe_until_reprobe_time(self, system_info):
+        """A failed probe should not be repeated on the next refresh."""
+        from addons.system_info.addon import NO_GPU_PANEL
+
+        assert system_info.get_gpu_info() == NO_GPU_PANEL
+        assert system_info.get_gpu_info() == NO_GPU_PANEL
+        assert len(system_info.probe_calls) == 1
+
+    def test_backoff_doubles_up_to_max(self, system_info):
+        """Repeated failures double the re-probe delay, capped at the max."""
+        from addons.system_info.addon import GPU_REPROBE_MAX_SEC, GPU_REPROBE_MIN_SEC
+
+        for _ in range(5):
+            system_info._gpu_reprobe_at = 0.0
+            system_info.get_gpu_info()
+
+        assert len(system_info.probe_calls) == 5
+        assert system_info._gpu_reprobe_delay == GPU_REPROBE_MAX_SEC > GPU_REPROBE_MIN_SEC
+
+
+class TestToolkitInfo:
+    """Tests for get_toolkit_info."""
+
+    def _completed(self, stdout, returncode=0):
+        import subprocess
+
+        return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr="")
+
+    def test_current_branch(self, monkeypatch):
+        """Branch, commit and behind status come from the marked ref."""
+        from addons.system_info import addon as system_info
+
+        refs = " \tdev\tbbbbbbb\t\n*\tmain\taaaaaaa\t[behind 2]\n"
+        monkeypatch.setattr(system_info, "_run_quick", lambda args, **kw: self._completed(refs))
+
+        info = system_info.SystemInfoAddon().get_toolkit_info()
+
+        assert "- Branch: `main`" in info
+        assert "- Commit: `aaaaaaa`" in info
+        assert "Update verfügbar" in info
+
+    def test_detached_head_shows_short_sha(self, monkeypatch):
+        """Without a current branch, the short HEAD commit is shown."""
+        from addons.system_info import addon as system_info
+
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args[1])
+            if args[1] == "rev-parse":
+                return self._completed("1234abc\n")
+            return self._completed(" \tmain\taaaaaaa\t\n")
+
+        monkeypatch.setattr(system_info, "_run_quick", fake_run)
+
+        info = system_info.SystemInfoAddon().get_toolkit_info()
+
+        assert calls == ["for-each-ref", "rev-parse"]
+        assert "- Branch: `(detached)`" in info
+        assert "- Commit: `1234abc`" in info
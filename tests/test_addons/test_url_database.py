@@ -1,5 +1,7 @@
 """Tests for addons/workflow_manager/url_database.py - Known model URLs."""
 
+import pytest
+
 
 class TestSuggestUrl:
     """Tests for suggest_url function."""
@@ -106,7 +108,7 @@ class TestKnownModel:
         assert model.url == "https://example.com/test.safetensors"
         assert model.size_mb == 1000
         assert model.target_path == "checkpoints"
-        assert model.aliases == []
+        assert model.aliases == ()
 
     def test_known_model_with_aliases(self):
         """Should support aliases for alternative filenames."""
@@ -217,3 +219,57 @@ class TestKnownModelsDatabase:
         # Allow some duplicates but not too many
         duplicate_count = len(urls) - len(unique_urls)
         assert duplicate_count < len(urls) * 0.1, "Too many duplicate URLs"
+
+
+class TestBuildLookup:
+    """Tests for _build_lookup - Precomputed case-insensitive index."""
+
+    def test_aliases_case_insensitive(self):
+        """Aliases should resolve to their model, ignoring case."""
+        from addons.workflow_manager.url_database import KnownModel, _build_lookup
+
+        model = KnownModel(
+            name="Test Model",
+            filename="Test.safetensors",
+            url="https://example.com/test.safetensors",
+            size_mb=1000,
+            target_path="checkpoints",
+            aliases=["Test_V1.safetensors"],
+        )
+        lookup = _build_lookup({"Test.safetensors": model})
+
+        assert lookup["test.safetensors"] is model
+        assert lookup["test_v1.safetensors"] is model
+
+    def test_filename_wins_over_alias(self):
+        """A filename key should not be shadowed by another model's alias."""
+        from addons.workflow_manager.url_database import KnownModel, _build_lookup
+
+        a = KnownModel("A", "a.safetensors", "https://example.com/a", 1, "vae", ["b.safetensors"])
+        b = KnownModel("B", "b.safetensors", "https://example.com/b", 1, "vae")
+        lookup = _build_lookup({"a.safetensors": a, "b.safetensors": b})
+
+        assert lookup["b.safetensors"] is b
+
+
+class TestKnownModelImmutability:
+    """Tests for the read-only model database."""
+
+    def test_known_model_frozen(self):
+        """KnownModel fields cannot be reassigned."""
+        import dataclasses
+
+        from addons.workflow_manager.url_database import KnownModel
+
+        model = KnownModel("M", "m.safetensors", "https://example.com/m", 1, "vae", ["a"])
+
+        assert model.aliases == ("a",)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            model.url = "https://evil.example"
+
+    def test_known_models_read_only(self):
+        """KNOWN_MODELS cannot be modified at runtime."""
+        from addons.workflow_manager.url_database import KNOWN_MODELS
+
+        with pytest.raises(TypeError):
+            KNOWN_MODELS["new.safetensors"] = None
@@ -93,6 +93,14 @@ class TestWorkflowManagerAllowlist:
         assert addon._is_allowed_folder("custom") is False
         assert addon._is_allowed_folder("") is False
 
+    def test_is_allowed_folder_nested(self, workflow_manager_instance):
+        """Nested subfolders are allowed, lookalike prefixes are not."""
+        addon = workflow_manager_instance
+
+        assert addon._is_allowed_folder("loras/sdxl/style") is True
+        assert addon._is_allowed_folder("loras_extra") is False
+        assert addon._is_allowed_folder("lorasx/wan") is False
+
     def test_add_target_folder_validates(self, workflow_manager_instance):
         """add_target_folder should validate against allowlist."""
         addon = workflow_manager_instance
@@ -126,6 +134,16 @@ class TestWorkflowManagerAllowlist:
         msg, folders = addon.add_target_folder("loras")
         assert "already exists" in msg
 
+    def test_add_target_folder_keeps_sorted(self, workflow_manager_instance):
+        """Folders loaded unsorted are sorted, and new folders are inserted in order."""
+        addon = workflow_manager_instance
+        addon._workflow_models = {"target_folders": ["vae", "loras"], "workflows": {}, "models": {}}
+
+        with patch.object(addon, "_save_workflow_models", return_value="Saved"):
+            _, folders = addon.add_target_folder("checkpoints")
+
+        assert folders == ["checkpoints", "loras", "vae"]
+
     def test_add_target_folder_empty_name(self, workflow_manager_instance):
         """Should reject empty folder names."""
         addon = workflow_manager_instance
@@ -213,6 +231,33 @@ class TestWorkflowManagerModelSets:
         for row in table:
             assert len(row) == 7
 
+    def test_get_models_table_tier_flags(self, wm_with_workflows):
+        """Tier checkboxes reflect which VRAM sets contain the model."""
+        addon = wm_with_workflows
+        table = {row[0]: row[3:6] for row in addon.get_models_table("gcv_wan_test")}
+
+        # S, M, L
+        assert table["model_a.safetensors"] == [False, True, True]
+        assert table["model_b.safetensors"] == [False, True, False]
+
+    def test_get_models_table_invalid_vram(self, wm_with_workflows):
+        """Negative or non-numeric vram_gb values list the model without tiers."""
+        addon = wm_with_workflows
+        addon._workflow_models["workflows"]["broken"] = {
+            "model_sets": {
+                "neg": {"vram_gb": -8, "models": ["model_a"]},
+                "text": {"vram_gb": "lots", "models": ["model_b"]},
+                "none": {"vram_gb": None, "models": ["model_b"]},
+            }
+        }
+
+        table = {row[0]: row[3:6] for row in addon.get_models_table("broken")}
+
+        assert table == {
+            "model_a.safetensors": [False, False, False],
+            "model_b.safetensors": [False, False, False],
+        }
+
     def test_get_models_table_empty_workflow(self, wm_with_workflows):
         """Should return empty list for non-existent workflow."""
         addon = wm_with_workflows
@@ -337,3 +382,226 @@ class TestVRAMTiers:
         assert 16 in addon.VRAM_TIERS["M"]
         assert 24 in addon.VRAM_TIERS["L"]
         assert 32 in addon.VRAM_TIERS["L"]
+
+
+class TestWorkflowManagerSave:
+    """Tests for dirty tracking when saving workflow_models.json."""
+
+    @pytest.fixture
+    def wm_instance(self, temp_config_dir, monkeypatch):
+        """Create WorkflowManager instance writing to a temp data dir."""
+        import sys
+
+        sys.modules["gradio"] = MagicMock()
+
+        data_dir = temp_config_dir["root"] / "data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        monkeypatch.setattr("addons.workflow_manager.addon.WorkflowManagerAddon.DATA_DIR", data_dir)
+
+        from addons.workflow_manager.addon import WorkflowManagerAddon
+
+        addon = WorkflowManagerAddon()
+        addon._load_workflow_models()
+        return addon
+
+    def test_save_writes_file(self, wm_instance):
+        """First save of a workflow should write the JSON file."""
+        table = [["model.safetensors", "loras", 100, True, False, False, ""]]
+
+        msg = wm_instance.save_workflow("gci_test", table)
+
+        assert msg.startswith("Saved")
+        data = json.loads((wm_instance.DATA_DIR / "workflow_models.json").read_text())
+        assert "gci_test" in data["workflows"]
+        assert data["models"]["model_safetensors"]["size_mb"] == 100
+
+    def test_unchanged_save_skips_write(self, wm_instance):
+        """Saving the same table again should not rewrite the file."""
+        table = [["model.safetensors", "loras", 100, True, False, False, ""]]
+        wm_instance.save_workflow("gci_test", table)
+
+        with patch("pathlib.Path.write_bytes") as write_bytes:
+            msg = wm_instance.save_workflow("gci_test", table)
+
+        assert msg.startswith("No changes")
+        write_bytes.assert_not_called()
+
+    def test_changed_save_writes(self, wm_instance):
+        """A changed tier assignment should be written."""
+        wm_instance.save_workflow("gci_test", [["m.safetensors", "vae", 1, True, False, False, ""]])
+
+        table = [["m.safetensors", "vae", 1, True, True, False, ""]]
+        msg = wm_instance.save_workflow("gci_test", table)
+
+        assert msg.startswith("Saved")
+
+    def test_save_from_dataframe(self, wm_instance):
+        """DataFrame input from gr.Dataframe is normalized column-wise."""
+        pd = pytest.importorskip("pandas")
+
+        df = pd.DataFrame(
+            [
+                [" model.safetensors ", "loras", 100.0, True, None, False, "https://x/m"],
+                ["", "", None, True, True, True, ""],
+            ],
+            columns=["Filename", "Folder", "MB", "S", "M", "L", "URL"],
+        )
+
+        wm_instance.save_workflow("gci_test", df)
+
+        model = wm_instance._workflow_models["models"]["model_safetensors"]
+        assert model["filename"] == "model.safetensors"
+        assert model["size_mb"] == 100
+        assert model["url"] == "https://x/m"
+        sets = wm_instance._workflow_models["workflows"]["gci_test"]["model_sets"]
+        assert set(sets) == {"8GB", "12GB"}
+
+
+class TestScanWorkflows:
+    """Tests for scan_workflows - Cached workflow directory listing."""
+
+    @pytest.fixture
+    def wm_instance(self, temp_dir):
+        """WorkflowManager pointing at a temp workflows directory."""
+        import sys
+
+        sys.modules["gradio"] = MagicMock()
+
+        from addons.workflow_manager.addon import WorkflowManagerAddon
+
+        (temp_dir / "gcv_a.json").write_text("{}")
+        (temp_dir / "gci_b.json").write_text("{}")
+        (temp_dir / "other.json").write_text("{}")
+
+        addon = WorkflowManagerAddon()
+        addon._workflows_path = temp_dir
+        addon._workflow_models = {"workflows": {"gci_b": {}}}
+        return addon
+
+    def test_lists_matching_workflows(self, wm_instance):
+        """Workflows in JSON come first, non-matching files are ignored."""
+        assert wm_instance.scan_workflows() == [("gci_b", True), ("gcv_a", False)]
+
+    def test_unchanged_directory_not_rescanned(self, wm_instance):
+        """A second scan of an unchanged directory should use the cache."""
+        wm_instance.scan_workflows()
+
+        with patch("os.scandir") as scandir:
+            wm_instance._workflow_models["workflows"]["gcv_a"] = {}
+            result = wm_instance.scan_workflows()
+
+        scandir.assert_not_called()
+        assert result == [("gci_b", True), ("gcv_a", True)]
+
+    def test_changed_directory_rescanned(self, wm_instance, temp_dir):
+        """Adding a workflow file should show up in the next scan."""
+        import os
+
+        wm_instance.scan_workflows()
+        (temp_dir / "gcv_c.json").write_text("{}")
+        os.utime(temp_dir, ns=(0, wm_instance._scan_cache[0] + 1_000_000))
+
+        assert ("gcv_c", False) in wm_instance.scan_workflows()
+
+    def test_choices_cached_until_scan_changes(self, wm_instance):
+        """Dropdown labels are reused until a workflow's JSON status changes."""
+        first = wm_instance.scan_workflow_choices()
+
+        assert first == [("✅ gci_b", "gci_b"), ("⚠️ gcv_a", "gcv_a")]
+        assert wm_instance.scan_workflow_choices() is first
+
+        wm_instance._workflow_models["workflows"]["gcv_a"] = {}
+        assert wm_instance.scan_workflow_choices()[1] == ("✅ gcv_a", "gcv_a")
+
+    def test_directories_ignored(self, wm_instance, temp_dir):
+        """Directories matching the pattern are not workflows."""
+        (temp_dir / "gcv_dir.json").mkdir()
+
+        assert all(wf_id != "gcv_dir" for wf_id, _ in wm_instance.scan_workflows())
+
+
+class TestParseWorkflowToTable:
+    """Tests for parse_workflow_to_table - mtime-keyed parse cache."""
+
+    @pytest.fixture
+    def wm_instance(self, temp_dir):
+        """WorkflowManager with one VAE-loading workflow on disk."""
+        import sys
+
+        sys.modules["gradio"] = MagicMock()
+
+        from addons.workflow_manager.addon import WorkflowManagerAddon
+
+        (temp_dir / "gci_a.json").write_text(
+            '{"nodes": [{"id": 1, "type": "VAELoader", "widgets_values": ["a.safetensors"]}]}'
+        )
+        addon = WorkflowManagerAddon()
+        addon._workflows_path = temp_dir
+        return addon
+
+    def test_unchanged_workflow_not_reparsed(self, wm_instance):
+        """A second parse of an unchanged file should come from the cache."""
+        first = wm_instance.parse_workflow_to_table("gci_a")
+
+        with patch("addons.workflow_manager.workflow_parser.load_file") as load_file:
+            second = wm_instance.parse_workflow_to_table("gci_a")
+
+        load_file.assert_not_called()
+        assert first == second
+        assert first[0][:2] == ["a.safetensors", "vae"]
+
+    def test_edited_workflow_reparsed(self, wm_instance, temp_dir):
+        """Touching the file invalidates the cached parse."""
+        import os
+
+        wf_file = temp_dir / "gci_a.json"
+        wm_instance.parse_workflow_to_table("gci_a")
+        wf_file.write_text(
+            '{"nodes": [{"id": 1, "type": "VAELoader", "widgets_values": ["b.safetensors"]}]}'
+        )
+        os.utime(wf_file, ns=(0, wf_file.stat().st_mtime_ns + 1_000_000))
+
+        assert wm_instance.parse_workflow_to_table("gci_a")[0][0] == "b.safetensors"
+
+    def test_missing_workflow_returns_empty(self, wm_instance):
+        """A missing file yields an empty table."""
+        assert wm_instance.parse_workflow_to_table("gci_missing") == []
+
+
+class TestLazyLoading:
+    """Tests for lazily loaded config and workflow_models.json."""
+
+    def test_workflow_models_loaded_on_first_access(self, temp_config_dir, monkeypatch):
+        """Files are not read until first access."""
+        import sys
+
+        sys.modules["gradio"] = MagicMock()
+
+        from addons.workflow_manager.addon import WorkflowManagerAddon
+
+        data_dir = temp_config_dir["root"] / "data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        (data_dir / "workflow_models.json").write_text('{"target_folders": ["vae"]}')
+        monkeypatch.setattr(WorkflowManagerAddon, "DATA_DIR", data_dir)
+
+        addon = WorkflowManagerAddon()
+        assert addon._workflow_models_data is None
+
+        assert addon.get_target_folders() == ["vae"]
+        assert addon._workflow_models_data is not None
+
+    def test_assigned_state_not_overwritten(self, temp_config_dir, monkeypatch):
+        """Explicitly assigned state wins over lazy loading."""
+        import sys
+
+        sys.modules["gradio"] = MagicMock()
+
+        from addons.workflow_manager.addon import WorkflowManagerAddon
+
+        monkeypatch.setattr(WorkflowManagerAddon, "CONFIG_DIR", temp_config_dir["config"])
+        addon = WorkflowManagerAddon()
+        addon._workflows_path = None
+        addon._workflow_models = {"target_folders": ["loras"]}
+
+        assert addon.scan_workflows() == []
+        assert addon.get_target_folders() == ["loras"]
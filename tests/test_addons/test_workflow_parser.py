@@ -1,6 +1,10 @@
 """Tests for addons/workflow_manager/workflow_parser.py - Workflow parsing."""
 
+import dataclasses
 import json
+from unittest.mock import patch
+
+import pytest
 
 
 class TestParseWorkflow:
@@ -184,6 +188,19 @@ class TestParseWorkflow:
         assert "clip1.safetensors" in filenames
         assert "clip2.safetensors" in filenames
 
+    def test_unchanged_file_served_from_cache(self, workflow_file):
+        """Re-parsing an unchanged file should not read it again."""
+        from addons.workflow_manager.workflow_parser import parse_workflow
+
+        first = parse_workflow(workflow_file)
+
+        with patch("addons.workflow_manager.workflow_parser.load_file") as load_file:
+            second = parse_workflow(workflow_file)
+
+        load_file.assert_not_called()
+        assert second == first
+        assert second is not first
+
 
 class TestParseWorkflowFromDict:
     """Tests for parse_workflow_from_dict function."""
@@ -217,6 +234,40 @@ class TestParseWorkflowFromDict:
         result = parse_workflow_from_dict(data)
         assert result == []
 
+    def test_parse_secondary_inputs(self):
+        """Should find secondary model inputs like parse_workflow does."""
+        from addons.workflow_manager.workflow_parser import parse_workflow_from_dict
+
+        data = {
+            "1": {
+                "class_type": "DualCLIPLoader",
+                "inputs": {"clip_name1": "clip1.safetensors", "clip_name2": "clip2.safetensors"},
+            }
+        }
+
+        filenames = [m.filename for m in parse_workflow_from_dict(data)]
+        assert filenames == ["clip1.safetensors", "clip2.safetensors"]
+
+    def test_input_dict_not_modified(self, sample_workflow_dict_format):
+        """Dict-format node ids come from the keys without writing into the nodes."""
+        import copy
+
+        from addons.workflow_manager.workflow_parser import parse_workflow_from_dict
+
+        original = copy.deepcopy(sample_workflow_dict_format)
+        models = parse_workflow_from_dict(sample_workflow_dict_format)
+
+        assert sample_workflow_dict_format == original
+        assert all(m.node_id in original for m in models)
+
+    def test_dict_widgets_values_ignored(self):
+        """Nodes storing widgets_values as a dict are skipped instead of raising."""
+        from addons.workflow_manager.workflow_parser import parse_workflow_from_dict
+
+        data = {"nodes": [{"id": 1, "type": "VAELoader", "widgets_values": {"vae": "x"}}]}
+
+        assert parse_workflow_from_dict(data) == []
+
 
 class TestParsedModel:
     """Tests for ParsedModel dataclass."""
@@ -239,6 +290,16 @@ class TestParsedModel:
         assert model.input_name == "unet_name"
         assert model.target_path == "diffusion_models"
 
+    def test_parsed_model_is_frozen(self):
+        """Cached parse results must not be mutable."""
+        from addons.workflow_manager.workflow_parser import ParsedModel
+
+        model = ParsedModel("a.safetensors", "VAELoader", "1", "vae_name", "vae")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            model.filename = "b.safetensors"
+        assert not hasattr(model, "__dict__")
+
 
 class TestModelLoaderNodes:
     """Tests for MODEL_LOADER_NODES constant."""
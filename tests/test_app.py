@@ -90,6 +90,26 @@ class TestDisclaimerSettings:
         # Should return False (default) on error
         assert is_disclaimer_accepted() is False
 
+    def test_settings_cached_until_file_changes(self, temp_dir, monkeypatch):
+        """Repeated queries should not re-read an unchanged settings file."""
+        import os
+
+        settings_file = temp_dir / "app_settings.json"
+        monkeypatch.setattr("app.SETTINGS_DIR", temp_dir)
+        monkeypatch.setattr("app.SETTINGS_FILE", settings_file)
+
+        from app import _load_app_settings, accept_disclaimer, is_disclaimer_accepted
+
+        accept_disclaimer()
+        with patch("core.json_utils.load_file") as mock_load:
+            assert is_disclaimer_accepted() is True
+        mock_load.assert_not_called()
+
+        # Edits made outside the app are picked up via the mtime
+        settings_file.write_text('{"disclaimer_accepted": false}')
+        os.utime(settings_file, ns=(0, settings_file.stat().st_mtime_ns + 1_000_000))
+        assert _load_app_settings() == {"disclaimer_accepted": False}
+
 
 class TestDetectRelease:
     """Tests for detect_release function."""
@@ -152,6 +172,44 @@ class TestDetectRelease:
         assert result == "full"
 
 
+class TestFindFreePort:
+    """Tests for find_free_port function."""
+
+    def test_returns_requested_port_when_free(self):
+        """A free requested port is used as-is."""
+        from app import _bind_port, find_free_port
+
+        port = _bind_port(0)
+
+        assert find_free_port(port) == port
+
+    def test_skips_busy_port(self):
+        """A busy port falls through to another free port."""
+        import socket
+
+        from app import find_free_port
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("", 0))
+            busy = s.getsockname()[1]
+
+            assert find_free_port(busy, max_attempts=1) != busy
+
+    def test_zero_asks_os(self):
+        """Port 0 yields an OS-assigned port."""
+        from app import find_free_port
+
+        assert find_free_port(0) > 0
+
+    def test_none_when_nothing_binds(self, monkeypatch):
+        """Without any bindable port, None is returned instead of raising."""
+        import app
+
+        monkeypatch.setattr(app, "_bind_port", lambda port: None)
+
+        assert app.find_free_port(7861, max_attempts=2) is None
+
+
 class TestDiskInfo:
     """Tests for _get_disk_info function."""
 
@@ -289,7 +347,7 @@ class TestCreateApp:
         # This is a smoke test - full UI testing would require Gradio test utils
 
         # Mock the addon loader to avoid loading real addons
-        with patch("app.AddonLoader") as MockLoader:
+        with patch("core.addon_loader.AddonLoader") as MockLoader:
             mock_loader = MagicMock()
             mock_loader.load_release_config.return_value = {
                 "name": "Test",
@@ -300,7 +358,10 @@ class TestCreateApp:
             mock_loader.load_release.return_value = []
             MockLoader.return_value = mock_loader
 
-            with patch("app.ConfigManager") as MockConfig:
+            with (
+                patch("core.config_manager._INSTANCE", None),
+                patch("core.config_manager.ConfigManager") as MockConfig,
+            ):
                 mock_config = MagicMock()
                 mock_config.get_models_path.return_value = None
                 mock_config.is_runpod.return_value = False
@@ -309,7 +370,7 @@ class TestCreateApp:
                 mock_config.get_comfyui_path.return_value = None
                 MockConfig.return_value = mock_config
 
-                with patch("app.ProfileSyncService"):
+                with patch("core.profile_sync.ProfileSyncService"):
                     with patch("app.is_disclaimer_accepted", return_value=True):
                         with patch("app.get_disclaimer_date", return_value="2024-01-01"):
                             from app import create_app
@@ -322,7 +383,7 @@ class TestCreateApp:
 
     def test_create_app_handles_missing_release(self, temp_config_dir, monkeypatch):
         """Should fall back to minimal when release not found."""
-        with patch("app.AddonLoader") as MockLoader:
+        with patch("core.addon_loader.AddonLoader") as MockLoader:
             mock_loader = MagicMock()
 
             # First call raises, second succeeds (fallback)
@@ -338,7 +399,10 @@ class TestCreateApp:
             mock_loader.load_release.return_value = []
             MockLoader.return_value = mock_loader
 
-            with patch("app.ConfigManager") as MockConfig:
+            with (
+                patch("core.config_manager._INSTANCE", None),
+                patch("core.config_manager.ConfigManager") as MockConfig,
+            ):
                 mock_config = MagicMock()
                 mock_config.get_models_path.return_value = None
                 mock_config.is_runpod.return_value = False
@@ -347,7 +411,7 @@ class TestCreateApp:
                 mock_config.get_comfyui_path.return_value = None
                 MockConfig.return_value = mock_config
 
-                with patch("app.ProfileSyncService"):
+                with patch("core.profile_sync.ProfileSyncService"):
                     with patch("app.is_disclaimer_accepted", return_value=True):
                         with patch("app.get_disclaimer_date", return_value="2024-01-01"):
                             from app import create_app
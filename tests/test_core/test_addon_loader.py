@@ -252,3 +252,85 @@ class UnloadTestAddon(BaseAddon):
 
         # Initially empty
         assert loader.get_loaded_addons() == []
+
+    def test_addon_module_imported_once(self, temp_config_dir, monkeypatch):
+        """Separate loaders should share one registered addon module."""
+        import sys
+
+        addons_dir = temp_config_dir["root"] / "addons"
+        (addons_dir / "once_test").mkdir(parents=True)
+        (addons_dir / "once_test" / "addon.py").write_text("""
+from core.base_addon import BaseAddon
+
+class OnceTestAddon(BaseAddon):
+    def get_tab_name(self):
+        return "Once"
+
+    def render(self):
+        return None
+""")
+
+        monkeypatch.setattr("core.addon_loader.AddonLoader.ADDONS_DIR", addons_dir)
+
+        from core.addon_loader import AddonLoader
+
+        try:
+            first = AddonLoader().load_addon("once_test")
+            second = AddonLoader().load_addon("once_test")
+
+            assert first is not second
+            assert type(first) is type(second)
+            assert type(first) is sys.modules["addons.once_test.addon"].OnceTestAddon
+        finally:
+            sys.modules.pop("addons.once_test.addon", None)
+
+    def test_package_addon_uses_package_module(self, monkeypatch):
+        """Bundled addons should resolve to the same class the package exports."""
+        from addons.model_depot import ModelDepotAddon
+        from core.addon_loader import AddonLoader
+
+        monkeypatch.setattr(ModelDepotAddon, "on_load", lambda self: None)
+
+        addon = AddonLoader().load_addon("model_depot")
+
+        assert type(addon) is ModelDepotAddon
+
+    def test_load_release_keeps_config_order(self, temp_config_dir, monkeypatch):
+        """Parallel loading should return addons in release config order."""
+        import sys
+
+        addons_dir = temp_config_dir["root"] / "addons"
+        releases_dir = temp_config_dir["config"] / "releases"
+        releases_dir.mkdir(parents=True, exist_ok=True)
+        ids = ["order_c", "order_a", "order_b", "order_off"]
+        for addon_id in ids:
+            (addons_dir / addon_id).mkdir(parents=True)
+            (addons_dir / addon_id / "addon.py").write_text(f"""
+from core.base_addon import BaseAddon
+
+class OrderAddon(BaseAddon):
+    def __init__(self):
+        super().__init__()
+        self.name = "{addon_id}"
+
+    def get_tab_name(self):
+        return self.name
+
+    def render(self):
+        return None
+""")
+        config = {"addons": [{"id": i} for i in ids[:3]] + [{"id": ids[3], "enabled": False}]}
+        (releases_dir / "ordered.json").write_text(json.dumps(config))
+
+        monkeypatch.setattr("core.addon_loader.AddonLoader.ADDONS_DIR", addons_dir)
+        monkeypatch.setattr("core.addon_loader.AddonLoader.RELEASES_DIR", releases_dir)
+
+        from core.addon_loader import AddonLoader
+
+        try:
+            addons = AddonLoader().load_release("ordered")
+        finally:
+            for addon_id in ids:
+                sys.modules.pop(f"addons.{addon_id}.addon", None)
+
+        assert [a.name for a in addons] == ["order_c", "order_a", "order_b"]
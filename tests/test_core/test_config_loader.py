@@ -0,0 +1,33 @@
+"""Tests for core/config_loader.py - Shared config.json reader."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+
+class TestLoadConfigFile:
+    """Tests for load_config_file."""
+
+    def test_reuses_parsed_config_until_file_changes(self, temp_dir):
+        """Unchanged files should be parsed once and shared."""
+        from core.config_loader import load_config_file
+
+        path = temp_dir / "config.json"
+        path.write_text('{"update": {"branch": "main"}}')
+
+        first = load_config_file(path)
+        with patch("core.config_loader.load_file") as mock_load:
+            assert load_config_file(path) is first
+        mock_load.assert_not_called()
+
+        path.write_text('{"update": {"branch": "dev"}}')
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+        assert load_config_file(path) == {"update": {"branch": "dev"}}
+
+    def test_missing_file_raises(self, temp_dir):
+        """Missing files raise OSError like a plain read."""
+        from core.config_loader import load_config_file
+
+        with pytest.raises(OSError):
+            load_config_file(temp_dir / "missing.json")
@@ -101,12 +101,23 @@ class TestConfigManager:
 
         config = ConfigManager()
         config.set("test_key", "test_value")
+        config.set("other_key", 1)
 
-        # Verify file was written
-        assert settings_file.exists()
+        # Changes are batched until flush()
+        with open(settings_file) as f:
+            assert "test_key" not in json.load(f)
+
+        with patch("core.config_manager.dump_file") as mock_dump:
+            config.flush()
+            config.flush()
+        mock_dump.assert_called_once()
+
+        config.set("test_key", "test_value")
+        config.flush()
         with open(settings_file) as f:
             saved = json.load(f)
         assert saved.get("test_key") == "test_value"
+        assert saved.get("other_key") == 1
 
     def test_get_all_returns_copy(self, temp_config_dir, monkeypatch):
         """get_all() should return a copy, not the original dict."""
@@ -162,6 +173,44 @@ class TestConfigManager:
         assert config.get("custom_key") is None
         assert config.get("download_parallel") == 2  # Default value
 
+    def test_get_config_manager_is_shared(self, temp_config_dir, monkeypatch):
+        """get_config_manager should build one instance and reuse it."""
+        monkeypatch.setattr(
+            "core.config_manager.ConfigManager.SETTINGS_FILE",
+            temp_config_dir["config"] / "settings.json",
+        )
+        monkeypatch.setattr("core.config_manager._INSTANCE", None)
+
+        from core.config_manager import ConfigManager, get_config_manager
+
+        config = get_config_manager()
+
+        assert isinstance(config, ConfigManager)
+        assert get_config_manager() is config
+
+    def test_config_json_loaded_on_first_use(self, config_file, temp_config_dir, monkeypatch):
+        """Constructing the manager should not read config.json."""
+        monkeypatch.setattr(
+            "core.config_manager.ConfigManager.CONFIG_DIR", temp_config_dir["config"]
+        )
+        monkeypatch.setattr(
+            "core.config_manager.ConfigManager.USER_CONFIG_DIR", temp_config_dir["user_config"]
+        )
+        monkeypatch.setattr(
+            "core.config_manager.ConfigManager.SETTINGS_FILE",
+            temp_config_dir["config"] / "settings.json",
+        )
+
+        from core.config_manager import ConfigManager
+
+        with patch("core.config_manager.load_config_file", return_value={"paths": {}}) as mock_load:
+            config = ConfigManager()
+            mock_load.assert_not_called()
+
+            config.get_comfyui_path()
+            config.get_comfyui_path()
+            mock_load.assert_called_once_with(config_file)
+
 
 class TestEnvironmentDetection:
     """Tests for environment detection methods."""
@@ -251,6 +300,36 @@ class TestEnvironmentDetection:
                 assert config.is_colab() is True
                 assert config.get_environment() == "colab"
 
+    def test_detection_cached_until_invalidated(self, temp_config_dir, monkeypatch):
+        """Environment checks should hit the filesystem once per instance."""
+        monkeypatch.setattr(
+            "core.config_manager.ConfigManager.PROJECT_DIR", temp_config_dir["root"]
+        )
+        monkeypatch.setattr(
+            "core.config_manager.ConfigManager.CONFIG_DIR", temp_config_dir["config"]
+        )
+        monkeypatch.setattr(
+            "core.config_manager.ConfigManager.USER_CONFIG_DIR", temp_config_dir["user_config"]
+        )
+        monkeypatch.setattr(
+            "core.config_manager.ConfigManager.SETTINGS_FILE",
+            temp_config_dir["config"] / "settings.json",
+        )
+
+        from core.config_manager import ConfigManager
+
+        config = ConfigManager()
+        with patch("os.path.exists", return_value=False) as mock_exists:
+            assert config.get_environment() == "local"
+            calls = mock_exists.call_count
+            assert config.get_environment() == "local"
+            assert mock_exists.call_count == calls
+
+            mock_exists.side_effect = lambda path: path == "/workspace"
+            assert config.get_environment() == "local"
+            config.invalidate_paths()
+            assert config.get_environment() == "runpod"
+
 
 class TestComfyUIPathDetection:
     """Tests for ComfyUI path detection."""
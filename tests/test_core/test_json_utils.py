@@ -0,0 +1,105 @@
+"""Tests for core/json_utils.py - JSON loading with optional orjson."""
+
+import json
+
+import pytest
+
+
+class TestJsonUtils:
+    """Tests for loads/load_file."""
+
+    def test_loads_bytes_and_str(self):
+        """Should accept both bytes and str input."""
+        from core.json_utils import loads
+
+        assert loads(b'{"a": 1}') == {"a": 1}
+        assert loads('{"a": "ü"}') == {"a": "ü"}
+
+    def test_load_file_utf8(self, temp_dir):
+        """Should parse UTF-8 files."""
+        from core.json_utils import load_file
+
+        path = temp_dir / "data.json"
+        path.write_text(json.dumps({"name": "Modell ä"}, ensure_ascii=False), encoding="utf-8")
+
+        assert load_file(path) == {"name": "Modell ä"}
+
+    def test_invalid_json_raises_decode_error(self):
+        """Invalid input raises json.JSONDecodeError with or without orjson."""
+        from core.json_utils import loads
+
+        with pytest.raises(json.JSONDecodeError):
+            loads(b"{invalid")
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Should fall back to stdlib json when orjson is unavailable."""
+        import core.json_utils as json_utils
+
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+        assert json_utils.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_dumps_indent_matches_stdlib(self, monkeypatch):
+        """Indented output should match json.dumps(indent=2, ensure_ascii=False)."""
+        import core.json_utils as json_utils
+
+        data = {"models": {"a": {"name": "Modell ä", "size_mb": 12, "tags": []}}}
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+        assert json_utils.dumps(data, indent=True) == expected
+
+        monkeypatch.setattr(json_utils, "orjson", None)
+        assert json_utils.dumps(data, indent=True) == expected
+
+    def test_dumps_compact_roundtrip(self):
+        """Compact output should parse back to the same object."""
+        from core.json_utils import dumps, loads
+
+        data = {"a": [1, 2], "b": "ü"}
+
+        assert loads(dumps(data)) == data
+
+    def test_dump_file_replaces_atomically(self, temp_dir):
+        """Should write the file and leave no temp file behind."""
+        from core.json_utils import dump_file
+
+        path = temp_dir / "data.json"
+        path.write_text("old")
+
+        dump_file(path, {"a": "ü"})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"a": "ü"}
+        assert list(temp_dir.iterdir()) == [path]
+
+    def test_dump_file_keeps_original_on_error(self, temp_dir):
+        """A serialization error must not touch the existing file."""
+        from core.json_utils import dump_file
+
+        path = temp_dir / "data.json"
+        path.write_text('{"a": 1}')
+
+        with pytest.raises(TypeError):
+            dump_file(path, {"a": object()})
+
+        assert path.read_text() == '{"a": 1}'
+        assert list(temp_dir.iterdir()) == [path]
+
+    def test_load_file_above_mmap_threshold(self, temp_dir, monkeypatch):
+        """Files above the mmap threshold are read normally."""
+        import core.json_utils as json_utils
+
+        monkeypatch.setattr(json_utils, "MMAP_MAX_SIZE", 1)
+        path = temp_dir / "data.json"
+        path.write_text('{"a": [1, 2, 3]}')
+
+        assert json_utils.load_file(path) == {"a": [1, 2, 3]}
+
+    def test_load_file_empty_raises_decode_error(self, temp_dir):
+        """An empty file is invalid JSON (and must not be mmapped)."""
+        from core.json_utils import load_file
+
+        path = temp_dir / "empty.json"
+        path.write_bytes(b"")
+
+        with pytest.raises(json.JSONDecodeError):
+            load_file(path)
@@ -107,3 +107,20 @@ class TestGetSSLContext:
 
         # Should return secure default
         assert ctx.verify_mode == ssl.CERT_REQUIRED
+
+    def test_context_cached_until_config_changes(self, temp_config_dir):
+        """Repeated calls reuse the context; editing config.json rebuilds it."""
+        import os
+
+        from core.ssl_utils import get_ssl_context
+
+        config_path = temp_config_dir["config"] / "config.json"
+        config_path.write_text(json.dumps({"security": {"disable_ssl_verify": False}}))
+
+        ctx = get_ssl_context(config_dir=temp_config_dir["root"])
+        assert get_ssl_context(config_dir=temp_config_dir["root"]) is ctx
+
+        config_path.write_text(json.dumps({"security": {"disable_ssl_verify": True}}))
+        os.utime(config_path, ns=(0, config_path.stat().st_mtime_ns + 1_000_000))
+
+        assert get_ssl_context(config_dir=temp_config_dir["root"]).verify_mode == ssl.CERT_NONE
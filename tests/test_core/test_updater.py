@@ -0,0 +1,43 @@
+"""Tests for core/updater.py - Git-based auto-updater."""
+
+import os
+import time
+from unittest.mock import patch
+
+
+class TestFetchRemote:
+    """Tests for GitUpdater.fetch_remote."""
+
+    def test_recent_fetch_is_skipped(self, temp_dir):
+        """A fresh FETCH_HEAD should skip the network fetch unless forced."""
+        from core.updater import GitUpdater
+
+        fetch_head = temp_dir / ".git" / "FETCH_HEAD"
+        fetch_head.parent.mkdir()
+        fetch_head.touch()
+
+        updater = GitUpdater(temp_dir)
+        with patch.object(updater, "_run_git", return_value=(True, "")) as mock_git:
+            assert updater.fetch_remote() is True
+            mock_git.assert_not_called()
+
+            assert updater.fetch_remote(force=True) is True
+            mock_git.assert_called_once_with("fetch", "origin", "main")
+
+    def test_stale_fetch_runs_git(self, temp_dir):
+        """An old or missing FETCH_HEAD should fetch again."""
+        from core.updater import GitUpdater
+
+        updater = GitUpdater(temp_dir)
+        with patch.object(updater, "_run_git", return_value=(True, "")) as mock_git:
+            assert updater.fetch_remote() is True
+            assert mock_git.call_count == 1
+
+            fetch_head = temp_dir / ".git" / "FETCH_HEAD"
+            fetch_head.parent.mkdir()
+            fetch_head.touch()
+            old = time.time() - GitUpdater.FETCH_TTL - 10
+            os.utime(fetch_head, (old, old))
+
+            assert updater.fetch_remote() is True
+            assert mock_git.call_count == 2